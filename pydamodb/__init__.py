@@ -41,7 +41,10 @@ from pydamodb.exceptions import (
     InvalidKeySchemaError,
     MissingSortKeyValueError,
     PydamoError,
+    TransactionTooLargeError,
     UnknownConditionTypeError,
+    UnprocessedItemsError,
+    UnprocessedKeysError,
 )
 from pydamodb.expressions import ExpressionField, UpdateMapping
 from pydamodb.sync_models import (
@@ -94,6 +97,9 @@ __all__ = [
     "SizeLt",
     "SizeLte",
     "SizeNe",
+    "TransactionTooLargeError",
     "UnknownConditionTypeError",
+    "UnprocessedItemsError",
+    "UnprocessedKeysError",
     "UpdateMapping",
 ]
@@ -9,6 +9,8 @@ Models are Pydantic `BaseModel` classes, with async DynamoDB helpers like save/d
 and class-level async query/update helpers.
 """
 
+import asyncio
+from collections.abc import AsyncGenerator, Iterable, Mapping
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
@@ -27,7 +29,7 @@ from pydamodb.base import (
     _PydamoModelBase,
 )
 from pydamodb.conditions import Condition
-from pydamodb.exceptions import IndexNotFoundError
+from pydamodb.exceptions import IndexNotFoundError, UnprocessedKeysError
 from pydamodb.expressions import UpdateMapping
 from pydamodb.keys import (
     DynamoDBKey,
@@ -37,6 +39,24 @@ from pydamodb.keys import (
 
 ModelType = TypeVar("ModelType", bound="_AsyncPydamoModelBase")
 
+# BatchGetItem accepts at most 100 keys per request.
+_BATCH_GET_MAX_KEYS = 100
+_BATCH_GET_MAX_ATTEMPTS = 10
+_BATCH_GET_MAX_CONCURRENCY = 8
+_BATCH_GET_BACKOFF_BASE = 0.05
+_BATCH_GET_BACKOFF_MAX = 1.0
+
+
+def _retrieve_task_exception(task: asyncio.Task[Any]) -> None:
+    """Mark a prefetch task's exception as retrieved.
+
+    A generator abandoned without being closed never awaits its prefetch task, and
+    asyncio would then log "Task exception was never retrieved". Awaiting the task
+    still raises the exception as usual.
+    """
+    if not task.cancelled():
+        task.exception()
+
 
 class _AsyncModelBatchWriter(Generic[ModelType]):
     """Async context manager for batch writing PydamoDB models to DynamoDB.
@@ -55,6 +75,8 @@ class _AsyncModelBatchWriter(Generic[ModelType]):
 
     """
 
+    __slots__ = ("_model_cls", "_overwrite_by_pkeys", "_table", "_writer")
+
     def __init__(
         self,
         model_cls: type[ModelType],
@@ -62,7 +84,8 @@ class _AsyncModelBatchWriter(Generic[ModelType]):
     ) -> None:
         self._model_cls = model_cls
         self._table = model_cls._table()
-        self._overwrite_by_pkeys = overwrite_by_pkeys or []
+        # aioboto3 treats None as no de-duplication, so no empty list is allocated.
+        self._overwrite_by_pkeys = overwrite_by_pkeys
         self._writer: BatchWriter | None = None
 
     async def __aenter__(self) -> Self:
@@ -89,7 +112,7 @@ class _AsyncModelBatchWriter(Generic[ModelType]):
                 " 'async with Model.batch_writer() as writer' before using put()."
             )
             raise RuntimeError(msg)
-        await self._writer.put_item(Item=model.model_dump(mode="json"))
+        await self._writer.put_item(Item=model._dump_item())
 
     async def delete(self, model: ModelType) -> None:
         """Delete a model instance using the batch writer."""
@@ -99,10 +122,7 @@ class _AsyncModelBatchWriter(Generic[ModelType]):
                 " 'async with Model.batch_writer() as writer' before using delete()."
             )
             raise RuntimeError(msg)
-        key = self._model_cls._build_dynamodb_key(
-            partition_key_value=model._partition_key_value,
-            sort_key_value=model._sort_key_value,
-        )
+        key = model._item_key()
         await self._writer.delete_item(Key=key)
 
 
@@ -116,7 +136,7 @@ class _AsyncPydamoModelBase(_PydamoModelBase[AsyncTable]):
     Features:
     - Async batch writing with automatic serialization
     - Cached key schema loading to avoid repeated async calls
-    - Index key schema lookup for GSIs and LSIs
+    - Cached index key schema lookup for GSIs and LSIs
     - Internal async CRUD operations (_async_get_item_key, _async_update_item_key...)
 
     Do not subclass this directly. Use AsyncPrimaryKeyModel or
@@ -125,12 +145,19 @@ class _AsyncPydamoModelBase(_PydamoModelBase[AsyncTable]):
 
     pydamo_config: ClassVar[PydamoConfig[AsyncTable]]
     _cached_key_schema: ClassVar[list[KeySchema] | None] = None
+    # Cached per table object, so re-pointing pydamo_config at another table reloads them.
+    _table_index_key_attributes: ClassVar[
+        tuple[AsyncTable, dict[str, tuple[str, str | None]]] | None
+    ] = None
 
     @classmethod
     async def _load_key_schema(cls) -> None:
-        """Load and cache the key schema from the table."""
-        if cls._cached_key_schema is None:
-            cls._cached_key_schema = await cls._table().key_schema
+        """Load and cache the key schema from the table.
+
+        Callers on the hot path guard this with ``if cls._cached_key_schema is None``
+        so that no coroutine is created once the schema is cached.
+        """
+        cls._cached_key_schema = await cls._table().key_schema
 
     @classmethod
     def _key_schema(cls) -> list[KeySchema]:
@@ -166,6 +193,25 @@ class _AsyncPydamoModelBase(_PydamoModelBase[AsyncTable]):
         """
         return _AsyncModelBatchWriter(cls, overwrite_by_pkeys=overwrite_by_pkeys)
 
+    @classmethod
+    async def _load_index_key_attributes(cls) -> dict[str, tuple[str, str | None]]:
+        """Load and cache the key attributes of every GSI and LSI on the table.
+
+        The table description is loaded at most once, with a single DescribeTable
+        call, and each index key schema is parsed once, so subsequent index queries
+        need no table lookups.
+        """
+        table = cls._table()
+        # Awaiting each autoloaded attribute on a cold resource would load it separately.
+        if table.meta.data is None:
+            await table.load()
+        gsis = await table.global_secondary_indexes
+        lsis = await table.local_secondary_indexes
+
+        index_key_attributes = cls._parse_index_key_attributes((*(gsis or []), *(lsis or [])))
+        cls._table_index_key_attributes = (table, index_key_attributes)
+        return index_key_attributes
+
     @classmethod
     async def _get_index_key_attributes(cls, *, index_name: str) -> tuple[str, str | None]:
         """Get the partition key and sort key attribute names for an index.
@@ -181,25 +227,16 @@ class _AsyncPydamoModelBase(_PydamoModelBase[AsyncTable]):
             IndexNotFoundError: If the index is not found on the table.
 
         """
-        table = cls._table()
-
-        # Check GSIs
-        gsis = await table.global_secondary_indexes or []
-        for gsi in gsis:
-            if gsi.get("IndexName") == index_name:
-                key_schema = gsi.get("KeySchema")
-                if key_schema is not None:
-                    return cls._parse_key_schema(key_schema=key_schema)
-
-        # Check LSIs
-        lsis = await table.local_secondary_indexes or []
-        for lsi in lsis:
-            if lsi.get("IndexName") == index_name:
-                key_schema = lsi.get("KeySchema")
-                if key_schema is not None:
-                    return cls._parse_key_schema(key_schema=key_schema)
+        cached = cls._table_index_key_attributes
+        if cached is not None and cached[0] is cls._table():
+            index_key_attributes = cached[1]
+        else:
+            index_key_attributes = await cls._load_index_key_attributes()
 
-        raise IndexNotFoundError(index_name=index_name)
+        try:
+            return index_key_attributes[index_name]
+        except KeyError:
+            raise IndexNotFoundError(index_name=index_name) from None
 
     async def save(self, *, condition: Condition | None = None) -> None:
         """Save the model to DynamoDB.
@@ -211,7 +248,8 @@ class _AsyncPydamoModelBase(_PydamoModelBase[AsyncTable]):
             ConditionCheckFailedError: If the condition is not satisfied.
 
         """
-        await self._load_key_schema()
+        if self._cached_key_schema is None:
+            await self._load_key_schema()
         table = self._table()
         put_kwargs = self._build_put_kwargs(condition=condition)
 
@@ -236,7 +274,6 @@ class _AsyncPydamoModelBase(_PydamoModelBase[AsyncTable]):
             ConditionCheckFailedError: If the condition is not satisfied.
 
         """
-        await cls._load_key_schema()
         table = cls._table()
         update_kwargs = cls._build_update_kwargs(key=key, updates=updates, condition=condition)
 
@@ -259,7 +296,6 @@ class _AsyncPydamoModelBase(_PydamoModelBase[AsyncTable]):
             ConditionCheckFailedError: If the condition is not satisfied.
 
         """
-        await cls._load_key_schema()
         table = cls._table()
         delete_kwargs = cls._build_delete_kwargs(key=key, condition=condition)
 
@@ -282,15 +318,75 @@ class _AsyncPydamoModelBase(_PydamoModelBase[AsyncTable]):
             The model instance if found, None otherwise.
 
         """
-        await cls._load_key_schema()
         table = cls._table()
 
         response = await table.get_item(Key=key, ConsistentRead=consistent_read)
-        item = response.get("Item")
-        if item is None:
+        try:
+            item = response["Item"]
+        except KeyError:
             return None
 
-        return cls.model_validate(item)
+        return cls._from_item(item)
+
+    @classmethod
+    async def _async_batch_get_keys(
+        cls,
+        *,
+        keys: Iterable[DynamoDBKey],
+        consistent_read: bool = False,
+    ) -> list[Self]:
+        """Get several items by their keys using BatchGetItem.
+
+        Keys are de-duplicated and sent in chunks of 100, with at most 8 requests in
+        flight. Unprocessed keys are retried with exponential backoff.
+
+        Args:
+            keys: The DynamoDB keys identifying the items to get.
+            consistent_read: Whether to use strongly consistent reads.
+
+        Returns:
+            The model instances found, in no particular order. Missing items are omitted.
+
+        Raises:
+            UnprocessedKeysError: If keys are still unprocessed after the last attempt.
+
+        """
+        unique_keys = list({tuple(key.items()): key for key in keys}.values())
+        table = cls._table()
+        client = table.meta.client
+        semaphore = asyncio.Semaphore(_BATCH_GET_MAX_CONCURRENCY)
+
+        async def fetch_chunk(chunk: list[DynamoDBKey]) -> list[dict[str, Any]]:
+            items: list[dict[str, Any]] = []
+            request_items: dict[str, Any] = {
+                table.name: {"Keys": chunk, "ConsistentRead": consistent_read}
+            }
+            async with semaphore:
+                for attempt in range(_BATCH_GET_MAX_ATTEMPTS):
+                    if attempt:
+                        delay = _BATCH_GET_BACKOFF_BASE * 2 ** (attempt - 1)
+                        await asyncio.sleep(min(delay, _BATCH_GET_BACKOFF_MAX))
+                    response = await client.batch_get_item(RequestItems=request_items)
+                    items.extend(response.get("Responses", {}).get(table.name, []))
+                    request_items = response.get("UnprocessedKeys") or {}
+                    if not request_items:
+                        return items
+            raise UnprocessedKeysError(unprocessed_keys=request_items[table.name]["Keys"])
+
+        tasks = [
+            asyncio.create_task(fetch_chunk(unique_keys[start : start + _BATCH_GET_MAX_KEYS]))
+            for start in range(0, len(unique_keys), _BATCH_GET_MAX_KEYS)
+        ]
+        try:
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            # gather leaves the other chunks running: cancel them and wait, so none
+            # keeps retrying in the background or drops an unretrieved exception.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return cls._from_items([item for page in pages for item in page])
 
     async def delete(self, *, condition: Condition | None = None) -> None:
         """Delete this item from DynamoDB.
@@ -302,13 +398,79 @@ class _AsyncPydamoModelBase(_PydamoModelBase[AsyncTable]):
             ConditionCheckFailedError: If the condition is not satisfied.
 
         """
-        await self._load_key_schema()
-        key = self._build_dynamodb_key(
-            partition_key_value=self._partition_key_value,
-            sort_key_value=self._sort_key_value,
-        )
+        if self._cached_key_schema is None:
+            await self._load_key_schema()
+        key = self._item_key()
         await self._async_delete_item_key(key=key, condition=condition)
 
+    @classmethod
+    async def get_item_by_key(
+        cls,
+        key: Mapping[str, KeyValue],
+        *,
+        consistent_read: bool = False,
+    ) -> Self | None:
+        """Get an item by a pre-built DynamoDB key.
+
+        Fast path for hot loops: skips key building and key schema loading. The key
+        must map every key attribute name of the table to its value, e.g.
+        ``{"user_id": "user-123", "order_id": "order-456"}``. The dict is copied
+        before the request, so it can be reused across calls.
+
+        Args:
+            key: The DynamoDB key identifying the item to get.
+            consistent_read: Whether to use strongly consistent reads.
+
+        Returns:
+            The model instance if found, None otherwise.
+
+        """
+        return await cls._async_get_item_key(key=dict(key), consistent_read=consistent_read)
+
+    @classmethod
+    async def update_item_by_key(
+        cls,
+        key: Mapping[str, KeyValue],
+        *,
+        updates: UpdateMapping,
+        condition: Condition | None = None,
+    ) -> None:
+        """Update an item by a pre-built DynamoDB key.
+
+        See get_item_by_key() for the expected key format.
+
+        Args:
+            key: The DynamoDB key identifying the item to update.
+            updates: A mapping of ExpressionField to new values.
+            condition: Optional condition that must be satisfied for the update.
+
+        Raises:
+            ConditionCheckFailedError: If the condition is not satisfied.
+
+        """
+        await cls._async_update_item_key(key=dict(key), updates=updates, condition=condition)
+
+    @classmethod
+    async def delete_item_by_key(
+        cls,
+        key: Mapping[str, KeyValue],
+        *,
+        condition: Condition | None = None,
+    ) -> None:
+        """Delete an item by a pre-built DynamoDB key.
+
+        See get_item_by_key() for the expected key format.
+
+        Args:
+            key: The DynamoDB key identifying the item to delete.
+            condition: Optional condition that must be satisfied for the delete.
+
+        Raises:
+            ConditionCheckFailedError: If the condition is not satisfied.
+
+        """
+        await cls._async_delete_item_key(key=dict(key), condition=condition)
+
 
 class AsyncPrimaryKeyModel(_AsyncPydamoModelBase):
     """Base model for DynamoDB tables with partition key only (async version).
@@ -356,10 +518,37 @@ class AsyncPrimaryKeyModel(_AsyncPydamoModelBase):
             The model instance if found, None otherwise.
 
         """
-        await cls._load_key_schema()
-        key = cls._build_dynamodb_key(partition_key_value=partition_key_value)
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
+        key = cls._key_builder()(partition_key_value, None)
         return await cls._async_get_item_key(key=key, consistent_read=consistent_read)
 
+    @classmethod
+    async def batch_get(
+        cls,
+        partition_key_values: Iterable[KeyValue],
+        *,
+        consistent_read: bool = False,
+    ) -> list[Self]:
+        """Get several items by their partition keys in batched requests.
+
+        Args:
+            partition_key_values: The partition key values.
+            consistent_read: Whether to use strongly consistent reads.
+
+        Returns:
+            The model instances found, in no particular order. Missing items are omitted.
+
+        Example:
+            users = await User.batch_get(["user-123", "user-456"])
+
+        """
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
+        build_key = cls._key_builder()
+        keys = [build_key(value, None) for value in partition_key_values]
+        return await cls._async_batch_get_keys(keys=keys, consistent_read=consistent_read)
+
     @classmethod
     async def update_item(
         cls,
@@ -382,8 +571,9 @@ class AsyncPrimaryKeyModel(_AsyncPydamoModelBase):
             await User.update_item("user-123", updates={User.attr("name"): "New Name"})
 
         """
-        await cls._load_key_schema()
-        key = cls._build_dynamodb_key(partition_key_value=partition_key_value)
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
+        key = cls._key_builder()(partition_key_value, None)
         await cls._async_update_item_key(key=key, updates=updates, condition=condition)
 
     @classmethod
@@ -407,8 +597,9 @@ class AsyncPrimaryKeyModel(_AsyncPydamoModelBase):
             await User.delete_item("user-123", condition=User.attr("status") == "inactive")
 
         """
-        await cls._load_key_schema()
-        key = cls._build_dynamodb_key(partition_key_value=partition_key_value)
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
+        key = cls._key_builder()(partition_key_value, None)
         await cls._async_delete_item_key(key=key, condition=condition)
 
 
@@ -461,13 +652,40 @@ class AsyncPrimaryKeyAndSortKeyModel(_AsyncPydamoModelBase):
             The model instance if found, None otherwise.
 
         """
-        await cls._load_key_schema()
-        key = cls._build_dynamodb_key(
-            partition_key_value=partition_key_value,
-            sort_key_value=sort_key_value,
-        )
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
+        key = cls._key_builder()(partition_key_value, sort_key_value)
         return await cls._async_get_item_key(key=key, consistent_read=consistent_read)
 
+    @classmethod
+    async def batch_get(
+        cls,
+        keys: Iterable[tuple[KeyValue, KeyValue]],
+        *,
+        consistent_read: bool = False,
+    ) -> list[Self]:
+        """Get several items by their composite keys in batched requests.
+
+        Args:
+            keys: (partition_key_value, sort_key_value) pairs.
+            consistent_read: Whether to use strongly consistent reads.
+
+        Returns:
+            The model instances found, in no particular order. Missing items are omitted.
+
+        Example:
+            orders = await Order.batch_get([("user-123", "order-1"), ("user-123", "order-2")])
+
+        """
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
+        build_key = cls._key_builder()
+        dynamodb_keys = [
+            build_key(partition_key_value, sort_key_value)
+            for partition_key_value, sort_key_value in keys
+        ]
+        return await cls._async_batch_get_keys(keys=dynamodb_keys, consistent_read=consistent_read)
+
     @classmethod
     async def update_item(
         cls,
@@ -496,11 +714,9 @@ class AsyncPrimaryKeyAndSortKeyModel(_AsyncPydamoModelBase):
             )
 
         """
-        await cls._load_key_schema()
-        key = cls._build_dynamodb_key(
-            partition_key_value=partition_key_value,
-            sort_key_value=sort_key_value,
-        )
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
+        key = cls._key_builder()(partition_key_value, sort_key_value)
         await cls._async_update_item_key(key=key, updates=updates, condition=condition)
 
     @classmethod
@@ -525,11 +741,9 @@ class AsyncPrimaryKeyAndSortKeyModel(_AsyncPydamoModelBase):
             await Order.delete_item("user-123", "order-456")
 
         """
-        await cls._load_key_schema()
-        key = cls._build_dynamodb_key(
-            partition_key_value=partition_key_value,
-            sort_key_value=sort_key_value,
-        )
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
+        key = cls._key_builder()(partition_key_value, sort_key_value)
         await cls._async_delete_item_key(key=key, condition=condition)
 
     @classmethod
@@ -583,7 +797,8 @@ class AsyncPrimaryKeyAndSortKeyModel(_AsyncPydamoModelBase):
             )
 
         """
-        await cls._load_key_schema()
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
         table = cls._table()
 
         # Determine which partition key attribute to use
@@ -606,13 +821,92 @@ class AsyncPrimaryKeyAndSortKeyModel(_AsyncPydamoModelBase):
 
         response = await table.query(**query_kwargs)
 
-        items = [cls.model_validate(item) for item in response.get("Items", [])]
+        items = cls._from_items(response.get("Items") or ())
         last_evaluated_key: LastEvaluatedKey | None = response.get("LastEvaluatedKey")  # ty: ignore[invalid-assignment]
 
-        return QueryResult(
-            items=items,
-            last_evaluated_key=last_evaluated_key,
-        )
+        return QueryResult(items, last_evaluated_key)
+
+    @classmethod
+    async def iter_all(
+        cls,
+        partition_key_value: KeyValue,
+        *,
+        sort_key_condition: Condition | None = None,
+        filter_condition: Condition | None = None,
+        consistent_read: bool = False,
+        index_name: str | None = None,
+    ) -> AsyncGenerator[Self, None]:
+        """Iterate over all items matching the partition key, page by page.
+
+        Items are yielded as each page arrives, so only one page is held in memory.
+        The request for the next page is sent before the current page is validated
+        and yielded, so network time overlaps with downstream processing.
+
+        The prefetch request is cancelled when the generator is closed. If you may
+        stop iterating early, wrap the call in ``contextlib.aclosing`` so that
+        happens right away rather than whenever the generator is garbage collected.
+
+        Args:
+            partition_key_value: The partition key value to query. When querying an
+                index, this should be the index's partition key value.
+            sort_key_condition: Optional condition on the sort key.
+            filter_condition: Optional filter condition applied after the query.
+            consistent_read: Whether to use strongly consistent reads.
+                Note: Consistent reads are not supported on global secondary indexes.
+            index_name: Optional name of a GSI or LSI to query instead of the table.
+
+        Yields:
+            Matching model instances.
+
+        Raises:
+            IndexNotFoundError: If the specified index does not exist on the table.
+
+        Example:
+            async with aclosing(Order.iter_all("user-123")) as orders:
+                async for order in orders:
+                    if process(order):
+                        break
+
+        """
+        if cls._cached_key_schema is None:
+            await cls._load_key_schema()
+        table = cls._table()
+
+        if index_name is not None:
+            pk_attr, _ = await cls._get_index_key_attributes(index_name=index_name)
+        else:
+            pk_attr = cls._partition_key_attribute()
+
+        def fetch_page(exclusive_start_key: LastEvaluatedKey | None) -> asyncio.Task[Any]:
+            # Kwargs are rebuilt per page, since each page has its own ExclusiveStartKey.
+            query_kwargs = cls._build_query_kwargs(
+                partition_key_attribute=pk_attr,
+                partition_key_value=partition_key_value,
+                sort_key_condition=sort_key_condition,
+                filter_condition=filter_condition,
+                limit=None,
+                consistent_read=consistent_read,
+                exclusive_start_key=exclusive_start_key,
+                index_name=index_name,
+            )
+            task = asyncio.create_task(table.query(**query_kwargs))
+            task.add_done_callback(_retrieve_task_exception)
+            return task
+
+        next_page: asyncio.Task[Any] | None = fetch_page(None)
+
+        try:
+            while next_page is not None:
+                response = await next_page
+                last_key = response.get("LastEvaluatedKey")
+                # Request the next page before validating this one so the network
+                # round trip overlaps with validation and the consumer's work.
+                next_page = fetch_page(last_key) if last_key is not None else None
+                for item in cls._from_items(response.get("Items") or ()):
+                    yield item
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
     @classmethod
     async def query_all(
@@ -626,8 +920,9 @@ class AsyncPrimaryKeyAndSortKeyModel(_AsyncPydamoModelBase):
     ) -> list[Self]:
         """Query all items matching the partition key, handling pagination automatically.
 
-        This method repeatedly calls query() until all matching items are retrieved.
-        Use this when you need all results and don't want to handle pagination manually.
+        This method keeps querying until all matching items are retrieved, prefetching
+        the next page like iter_all(). Use this when you need all results and don't
+        want to handle pagination manually; prefer iter_all() for large result sets.
 
         Args:
             partition_key_value: The partition key value to query. When querying an
@@ -655,24 +950,16 @@ class AsyncPrimaryKeyAndSortKeyModel(_AsyncPydamoModelBase):
             )
 
         """
-        all_items: list[Self] = []
-        last_key: LastEvaluatedKey | None = None
-
-        while True:
-            items, last_key = await cls.query(
-                partition_key_value=partition_key_value,
+        return [
+            item
+            async for item in cls.iter_all(
+                partition_key_value,
                 sort_key_condition=sort_key_condition,
                 filter_condition=filter_condition,
                 consistent_read=consistent_read,
-                exclusive_start_key=last_key,
                 index_name=index_name,
             )
-            all_items.extend(items)
-
-            if last_key is None:
-                break
-
-        return all_items
+        ]
 
 
 # Type aliases for convenience
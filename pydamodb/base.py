@@ -6,13 +6,19 @@ duplication while maintaining type safety and Pydantic compatibility.
 """
 
 import types as _types
-from collections.abc import Sequence
+from abc import abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+from decimal import Decimal
+from functools import partial
+from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Generic,
+    Literal,
     NamedTuple,
+    TypeGuard,
     TypeVar,
     Union,
     get_args,
@@ -20,9 +26,9 @@ from typing import (
     get_type_hints,
 )
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from pydantic_core import to_jsonable_python
-from typing_extensions import TypedDict, is_typeddict
+from typing_extensions import NotRequired, Self, TypedDict, is_typeddict
 
 from pydamodb.conditions import Condition
 from pydamodb.exceptions import InvalidKeySchemaError, MissingSortKeyValueError
@@ -168,15 +174,166 @@ def _validate_nested_path(field_info: Any, rest: str, root: str) -> None:
             break
 
 
+def _trusted_field_converters(model_cls: type[BaseModel]) -> dict[str, Callable[[Any], Any]]:
+    """Map the stored attribute names of fields that need rebuilding on unvalidated reads.
+
+    Items are written in JSON mode, and DynamoDB returns every number as ``Decimal``.
+    ``int``, ``float`` and ``Decimal`` fields are converted back with the type itself;
+    models and lists of models are rebuilt with ``model_construct``, recursively.
+    ``str``, ``bool`` and ``Any`` fields, ``str``/``bool`` literals, and lists and
+    dicts of those are used as stored. Every other type (e.g. ``datetime``, ``UUID``,
+    ``Enum``, sets, containers of numbers) is converted by a ``TypeAdapter`` for that
+    field alone. ``| None`` is allowed on any of these.
+    """
+    converters: dict[str, Callable[[Any], Any]] = {}
+    for name, field_info in model_cls.model_fields.items():
+        converter = _trusted_converter(field_info.annotation)
+        if converter is not None:
+            # Items are keyed by alias when written with serialize_by_alias (or by other
+            # writers following attr()'s alias paths), and by field name otherwise.
+            converters[field_info.alias or name] = converter
+            converters[name] = converter
+    return converters
+
+
+def _trusted_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    if isinstance(annotation, _types.UnionType) or get_origin(annotation) is Union:
+        non_none = [a for a in get_args(annotation) if a is not type(None)]
+        if len(non_none) == 1:
+            annotation = non_none[0]
+    if annotation is int or annotation is float or annotation is Decimal:
+        return annotation
+    if _is_model_class(annotation):
+        return partial(_construct_nested, annotation)
+    if get_origin(annotation) is list:
+        # A bare typing.List has list as its origin but no type arguments.
+        args = get_args(annotation)
+        if len(args) == 1 and _is_model_class(args[0]):
+            return partial(_construct_nested_list, args[0])
+    if _stored_as_is(annotation):
+        return None
+    return TypeAdapter(annotation).validate_python
+
+
+def _stored_as_is(annotation: Any) -> bool:
+    """Whether values of this type read back from DynamoDB exactly as they were dumped."""
+    if annotation in (str, bool, Any, list, dict, type(None)):
+        return True
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Literal:
+        return all(isinstance(arg, (str, bool)) for arg in args)
+    if isinstance(annotation, _types.UnionType) or origin is Union or origin in (list, dict):
+        return all(_stored_as_is(arg) for arg in args)
+    return False
+
+
+def _is_model_class(annotation: Any) -> TypeGuard[type[BaseModel]]:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _cached_trusted_converters(model_cls: type[BaseModel]) -> dict[str, Callable[[Any], Any]]:
+    """Get the trusted-read converters of a model class, building them once."""
+    # Kept in the class namespace: subclasses never reuse a parent's cache, and the
+    # cache goes away with the class instead of pinning it in a module-level dict.
+    converters = model_cls.__dict__.get("_trusted_converters")
+    if converters is None:
+        converters = _trusted_field_converters(model_cls)
+        model_cls._trusted_converters = converters  # ty: ignore[unresolved-attribute]
+    return converters
+
+
+def _construct_nested(model_cls: type[BaseModel], data: Any) -> Any:
+    """Rebuild a nested model from a trusted DynamoDB map without validation."""
+    if not isinstance(data, dict):
+        return data
+    for attribute, convert in _cached_trusted_converters(model_cls).items():
+        value = data.get(attribute)
+        if value is not None:
+            data[attribute] = convert(value)
+    return model_cls.model_construct(**data)
+
+
+def _construct_nested_list(model_cls: type[BaseModel], data: Any) -> Any:
+    if not isinstance(data, list):
+        return data
+    return [_construct_nested(model_cls, element) for element in data]
+
+
+_KeyBuilder = Callable[[KeyValue, KeyValue | None], DynamoDBKey]
+
+
+def _jsonable_key(value: KeyValue) -> Any:
+    """Convert a key value like ``to_jsonable_python``, skipping the call for str/int."""
+    if type(value) is str or type(value) is int:
+        return value
+    return to_jsonable_python(value)
+
+
+def _make_key_builder(
+    partition_key_attribute: str, sort_key_attribute: str | None, model_name: str
+) -> _KeyBuilder:
+    """Build a key function specialized for a partition-only or composite key."""
+    # Bound as a closure variable so the hot builders skip a global lookup per value.
+    jsonable_key = _jsonable_key
+
+    if sort_key_attribute is None:
+
+        def build_partition_key(
+            partition_key_value: KeyValue, sort_key_value: KeyValue | None = None
+        ) -> DynamoDBKey:
+            return {partition_key_attribute: jsonable_key(partition_key_value)}
+
+        return build_partition_key
+
+    def build_composite_key(
+        partition_key_value: KeyValue, sort_key_value: KeyValue | None = None
+    ) -> DynamoDBKey:
+        if sort_key_value is None:
+            raise MissingSortKeyValueError(model_name=model_name)
+        return {
+            partition_key_attribute: jsonable_key(partition_key_value),
+            sort_key_attribute: jsonable_key(sort_key_value),
+        }
+
+    return build_composite_key
+
+
+def _make_item_key_getter(
+    partition_key_attribute: str, sort_key_attribute: str | None, key_builder: _KeyBuilder
+) -> Callable[[Any], DynamoDBKey]:
+    """Build a function returning the DynamoDB key of a model instance."""
+    if sort_key_attribute is None:
+        get_partition_key = attrgetter(partition_key_attribute)
+
+        def partition_item_key(instance: Any) -> DynamoDBKey:
+            return key_builder(get_partition_key(instance), None)
+
+        return partition_item_key
+
+    get_key_values = attrgetter(partition_key_attribute, sort_key_attribute)
+
+    def composite_item_key(instance: Any) -> DynamoDBKey:
+        return key_builder(*get_key_values(instance))
+
+    return composite_item_key
+
+
 class PydamoConfig(TypedDict, Generic[Table]):
     """Configuration required on each model class.
 
     Attributes:
         table: The DynamoDB Table resource associated with the model.
+        trust_stored: Build models read from DynamoDB with ``model_construct``
+            instead of validating them. Only enable this when every item in the
+            table was written by this model. Fields whose stored form differs
+            from their type (numbers, dates, enums, nested models, ...) are still
+            converted back. Defaults to False.
 
     """
 
     table: Table
+    trust_stored: NotRequired[bool]
 
 
 class _PydamoModelBase(BaseModel, Generic[Table]):
@@ -199,6 +356,21 @@ class _PydamoModelBase(BaseModel, Generic[Table]):
     """
 
     pydamo_config: ClassVar[PydamoConfig[Table]]  # ty: ignore[invalid-type-form]
+    _list_adapter: ClassVar[TypeAdapter[list[Any]] | None] = None
+    _trusted_converters: ClassVar[dict[str, Callable[[Any], Any]] | None] = None
+    _field_path_map: ClassVar[dict[str, str] | None] = None
+    _field_expressions: ClassVar[dict[str, ExpressionField] | None] = None
+    _query_templates: ClassVar[
+        dict[tuple[str, str | None, bool], tuple[dict[str, Any], str]] | None
+    ] = None
+    _update_templates: ClassVar[
+        dict[tuple[str, ...], tuple[str, dict[str, str], tuple[str, ...]]] | None
+    ] = None
+    _parsed_key_schema: ClassVar[tuple[Sequence[KeySchema], tuple[str, str | None]] | None] = None
+    _cached_key_builder: ClassVar[tuple[Sequence[KeySchema], _KeyBuilder] | None] = None
+    _cached_item_key_getter: ClassVar[
+        tuple[Sequence[KeySchema], Callable[[Any], DynamoDBKey]] | None
+    ] = None
 
     @classmethod
     def attr(cls, path: str) -> ExpressionField:
@@ -220,31 +392,86 @@ class _PydamoModelBase(BaseModel, Generic[Table]):
             AttributeError: If the root field does not exist or is private.
 
         """
+        # Top-level fields are the common case: return the shared, immutable instance.
+        field_expressions = cls.__dict__.get("_field_expressions")
+        if field_expressions is None:
+            field_expressions = {
+                name: ExpressionField(alias) for name, alias in cls._field_paths().items()
+            }
+            cls._field_expressions = field_expressions
+        field = field_expressions.get(path)
+        if field is not None:
+            return field
+
         # Root is everything before the first '.' or '['.
         root_end = next((i for i, c in enumerate(path) if c in ".["), len(path))
         root = path[:root_end]
         rest = path[root_end:]
 
-        if root.startswith("_"):
-            raise AttributeError(f"Cannot access private attribute '{root}'")
-        if root not in cls.model_fields:
+        alias = cls._field_paths().get(root)
+        if alias is None:
+            if root.startswith("_"):
+                raise AttributeError(f"Cannot access private attribute '{root}'")
             raise AttributeError(f"'{cls.__name__}' has no field '{root}'")
 
-        field_info = cls.model_fields[root]
-        alias = field_info.alias or root
-
         if rest:
-            _validate_nested_path(field_info, rest, root)
+            _validate_nested_path(cls.model_fields[root], rest, root)
 
         return ExpressionField(alias + rest)
 
+    @classmethod
+    def _field_paths(cls) -> dict[str, str]:
+        """Map each model field name to its DynamoDB attribute name (alias or name)."""
+        # Look up in the class namespace so subclasses never reuse a parent's cache.
+        field_paths = cls.__dict__.get("_field_path_map")
+        if field_paths is None:
+            field_paths = {
+                name: field_info.alias or name for name, field_info in cls.model_fields.items()
+            }
+            cls._field_path_map = field_paths
+        return field_paths
+
+    @classmethod
+    def _construct_item(cls, item: dict[str, Any]) -> Self:
+        """Build a model instance from a trusted DynamoDB item without validation."""
+        for attribute, convert in _cached_trusted_converters(cls).items():
+            value = item.get(attribute)
+            if value is not None:
+                item[attribute] = convert(value)
+
+        return cls.model_construct(**item)
+
+    @classmethod
+    def _from_item(cls, item: dict[str, Any]) -> Self:
+        """Build a model instance from a raw DynamoDB item."""
+        if cls.pydamo_config.get("trust_stored", False):
+            return cls._construct_item(item)
+        return cls.model_validate(item)
+
+    @classmethod
+    def _from_items(cls, items: Sequence[dict[str, Any]]) -> list[Self]:
+        """Build model instances from a page of raw DynamoDB items.
+
+        The whole page is validated in a single call to a cached
+        ``TypeAdapter(list[cls])``, so the per-item loop runs inside pydantic-core.
+        """
+        if cls.pydamo_config.get("trust_stored", False):
+            return [cls._construct_item(item) for item in items]
+
+        adapter = cls.__dict__.get("_list_adapter")
+        if adapter is None:
+            adapter = TypeAdapter(list[cls])  # ty: ignore[invalid-type-form]
+            cls._list_adapter = adapter
+        return adapter.validate_python(items)
+
     @classmethod
     def _table(cls) -> Table:
         return cls.pydamo_config["table"]
 
     @classmethod
+    @abstractmethod
     def _key_schema(cls) -> list[KeySchema]:
-        raise NotImplementedError
+        """Return the table's key schema. Implemented by the sync and async bases."""
 
     @staticmethod
     def _parse_key_schema(*, key_schema: Sequence[KeySchema]) -> tuple[str, str | None]:
@@ -254,37 +481,61 @@ class _PydamoModelBase(BaseModel, Generic[Table]):
             InvalidKeySchemaError: If no partition key is present.
 
         """
-        partition_key_attribute: str | None = None
-        sort_key_attribute: str | None = None
-
-        for key_element in key_schema:
-            if key_element["KeyType"] == "HASH":
-                partition_key_attribute = key_element["AttributeName"]
-            elif key_element["KeyType"] == "RANGE":
-                sort_key_attribute = key_element["AttributeName"]
+        keys_by_type = {
+            key_element["KeyType"]: key_element["AttributeName"] for key_element in key_schema
+        }
 
+        partition_key_attribute = keys_by_type.get("HASH")
         if partition_key_attribute is None:
             raise InvalidKeySchemaError()
 
-        return partition_key_attribute, sort_key_attribute
+        return partition_key_attribute, keys_by_type.get("RANGE")
+
+    @classmethod
+    def _parse_index_key_attributes(
+        cls, indexes: Iterable[Any]
+    ) -> dict[str, tuple[str, str | None]]:
+        """Map each GSI/LSI description to its (partition_key, sort_key) attribute names."""
+        index_key_attributes: dict[str, tuple[str, str | None]] = {}
+        for index in indexes:
+            index_name = index.get("IndexName")
+            key_schema = index.get("KeySchema")
+            if index_name is not None and key_schema is not None:
+                index_key_attributes[index_name] = cls._parse_key_schema(key_schema=key_schema)
+        return index_key_attributes
+
+    @classmethod
+    def _key_attributes(cls) -> tuple[str, str | None]:
+        """Get the (partition_key, sort_key) attribute names of the table.
+
+        The parsed pair is cached on the class and reused for as long as
+        _key_schema() returns the same schema object, so re-pointing a model at
+        another table is picked up automatically.
+        """
+        key_schema = cls._key_schema()
+        parsed = cls._parsed_key_schema
+        if parsed is not None and parsed[0] is key_schema:
+            return parsed[1]
+
+        key_attributes = cls._parse_key_schema(key_schema=key_schema)
+        cls._parsed_key_schema = (key_schema, key_attributes)
+        return key_attributes
 
     @classmethod
     def _partition_key_attribute(cls) -> str:
-        partition_key_attribute, _ = cls._parse_key_schema(key_schema=cls._key_schema())
-        return partition_key_attribute
+        return cls._key_attributes()[0]
 
     @property
     def _partition_key_value(self) -> KeyValue:
-        return getattr(self, self._partition_key_attribute())
+        return getattr(self, self._key_attributes()[0])
 
     @classmethod
     def _sort_key_attribute(cls) -> str | None:
-        _, sort_key_attribute = cls._parse_key_schema(key_schema=cls._key_schema())
-        return sort_key_attribute
+        return cls._key_attributes()[1]
 
     @property
     def _sort_key_value(self) -> KeyValue | None:
-        sort_key_attribute = self._sort_key_attribute()
+        sort_key_attribute = self._key_attributes()[1]
         return getattr(self, sort_key_attribute) if sort_key_attribute else None
 
     @classmethod
@@ -307,16 +558,55 @@ class _PydamoModelBase(BaseModel, Generic[Table]):
             MissingSortKeyValueError: If the table has a sort key but no value provided.
 
         """
-        partition_key_attribute = cls._partition_key_attribute()
-        key: DynamoDBKey = {partition_key_attribute: to_jsonable_python(partition_key_value)}
+        return cls._key_builder()(partition_key_value, sort_key_value)
+
+    @classmethod
+    def _key_builder(cls) -> _KeyBuilder:
+        """Get the key function specialized for this model's key schema.
+
+        Whether the table has a sort key is resolved once, so building a key is a
+        single call with no per-call schema lookups or branches on the key shape.
+        Cached like _key_attributes(), but in the class namespace because the
+        function captures the model name for its error message.
+        """
+        key_schema = cls._key_schema()
+        cached = cls.__dict__.get("_cached_key_builder")
+        if cached is not None and cached[0] is key_schema:
+            return cached[1]
+
+        partition_key_attribute, sort_key_attribute = cls._key_attributes()
+        key_builder = _make_key_builder(partition_key_attribute, sort_key_attribute, cls.__name__)
+        cls._cached_key_builder = (key_schema, key_builder)
+        return key_builder
+
+    def _item_key(self) -> DynamoDBKey:
+        """Build the DynamoDB key of this instance.
+
+        The key attribute getters are resolved once per key schema, like
+        _key_builder(), so no per-call schema lookups are needed.
+        """
+        cls = type(self)
+        key_schema = cls._key_schema()
+        cached = cls.__dict__.get("_cached_item_key_getter")
+        if cached is None or cached[0] is not key_schema:
+            partition_key_attribute, sort_key_attribute = cls._key_attributes()
+            getter = _make_item_key_getter(
+                partition_key_attribute, sort_key_attribute, cls._key_builder()
+            )
+            cached = cls._cached_item_key_getter = (key_schema, getter)
+        return cached[1](self)
 
-        sort_key_attribute = cls._sort_key_attribute()
-        if sort_key_attribute is not None:
-            if sort_key_value is None:
-                raise MissingSortKeyValueError(model_name=cls.__name__)
-            key[sort_key_attribute] = to_jsonable_python(sort_key_value)
+    def _dump_item(self) -> dict[str, Any]:
+        """Serialize the model into a DynamoDB item.
 
-        return key
+        Equivalent to ``model_dump(mode="json")`` but calls the compiled pydantic-core
+        serializer directly, skipping the Python-level argument forwarding.
+        """
+        return self.__pydantic_serializer__.to_python(
+            self,
+            mode="json",
+            by_alias=self.model_config.get("serialize_by_alias", False),
+        )
 
     def _build_put_kwargs(self, *, condition: Condition | None) -> dict[str, Any]:
         """Build kwargs dictionary for put_item operation.
@@ -328,7 +618,7 @@ class _PydamoModelBase(BaseModel, Generic[Table]):
             Dictionary of kwargs to pass to table.put_item().
 
         """
-        put_kwargs: dict[str, Any] = {"Item": self.model_dump(mode="json")}
+        put_kwargs: dict[str, Any] = {"Item": self._dump_item()}
 
         if condition is not None:
             builder = ExpressionBuilder()
@@ -358,6 +648,21 @@ class _PydamoModelBase(BaseModel, Generic[Table]):
             Dictionary of kwargs to pass to table.update_item().
 
         """
+        if condition is None and updates:
+            update_expression, attribute_names, value_placeholders = cls._update_template(
+                tuple(str(field) for field in updates)
+            )
+            # Only the expression layout is cached: the values differ on every call.
+            return {
+                "Key": key,
+                "UpdateExpression": update_expression,
+                "ExpressionAttributeNames": attribute_names,
+                "ExpressionAttributeValues": {
+                    placeholder: to_jsonable_python(value)
+                    for placeholder, value in zip(value_placeholders, updates.values(), strict=True)
+                },
+            }
+
         builder = ExpressionBuilder()
         update_expression = builder.build_update_expression(updates)
 
@@ -368,15 +673,52 @@ class _PydamoModelBase(BaseModel, Generic[Table]):
                 condition
             )
 
-        update_kwargs |= {
-            "Key": key,
-            "UpdateExpression": update_expression,
-            "ExpressionAttributeNames": builder.attribute_names,
-            "ExpressionAttributeValues": builder.attribute_values,
-        }
+        update_kwargs["Key"] = key
+        update_kwargs["UpdateExpression"] = update_expression
+        update_kwargs["ExpressionAttributeNames"] = builder.attribute_names
+        update_kwargs["ExpressionAttributeValues"] = builder.attribute_values
 
         return update_kwargs
 
+    @classmethod
+    def _update_template(
+        cls, field_paths: tuple[str, ...]
+    ) -> tuple[str, dict[str, str], tuple[str, ...]]:
+        """Get the cached UpdateExpression scaffolding for an unconditional update.
+
+        Only updates of top-level attributes are cached, so the cache is bounded by
+        the model's fields. Nested paths such as map keys or list indices are often
+        dynamic, so their scaffolding is built on every call.
+
+        Args:
+            field_paths: The updated field paths, in update order.
+
+        Returns:
+            The UpdateExpression, its ExpressionAttributeNames, and the value
+            placeholders the new values must be bound to, in update order.
+
+        """
+        # Look up in the class namespace so subclasses never reuse a parent's cache.
+        templates = cls.__dict__.get("_update_templates")
+        if templates is None:
+            templates = cls._update_templates = {}
+
+        cached = templates.get(field_paths)
+        if cached is None:
+            builder = ExpressionBuilder()
+            update_expression = builder.build_update_expression(
+                dict.fromkeys(map(ExpressionField, field_paths))
+            )
+            cached = (
+                update_expression,
+                builder.attribute_names,
+                tuple(builder.attribute_values),
+            )
+            if not any("." in path or "[" in path for path in field_paths):
+                templates[field_paths] = cached
+
+        return cached
+
     @classmethod
     def _build_delete_kwargs(
         cls, *, key: DynamoDBKey, condition: Condition | None
@@ -404,6 +746,43 @@ class _PydamoModelBase(BaseModel, Generic[Table]):
 
         return delete_kwargs
 
+    @classmethod
+    def _query_template(
+        cls,
+        *,
+        partition_key_attribute: str,
+        index_name: str | None,
+        consistent_read: bool,
+    ) -> tuple[dict[str, Any], str]:
+        """Get the cached query kwargs for a partition-key-only query of this shape.
+
+        Returns:
+            The kwargs without ExpressionAttributeValues, and the value placeholder
+            the partition key value must be bound to.
+
+        """
+        # Look up in the class namespace so subclasses never reuse a parent's cache.
+        templates = cls.__dict__.get("_query_templates")
+        if templates is None:
+            templates = cls._query_templates = {}
+
+        cache_key = (partition_key_attribute, index_name, consistent_read)
+        cached = templates.get(cache_key)
+        if cached is None:
+            builder = ExpressionBuilder()
+            key_condition = builder.build_key_equality(partition_key_attribute, None)
+            template: dict[str, Any] = {
+                "KeyConditionExpression": key_condition,
+                "ConsistentRead": consistent_read,
+                "ExpressionAttributeNames": builder.attribute_names,
+            }
+            if index_name is not None:
+                template["IndexName"] = index_name
+            (value_placeholder,) = builder.attribute_values
+            cached = templates[cache_key] = (template, value_placeholder)
+
+        return cached
+
     @classmethod
     def _build_query_kwargs(
         cls,
@@ -433,32 +812,43 @@ class _PydamoModelBase(BaseModel, Generic[Table]):
             Dictionary of kwargs to pass to table.query().
 
         """
-        builder = ExpressionBuilder()
+        query_kwargs: dict[str, Any]
+        if sort_key_condition is None and filter_condition is None:
+            template, value_placeholder = cls._query_template(
+                partition_key_attribute=partition_key_attribute,
+                index_name=index_name,
+                consistent_read=consistent_read,
+            )
+            query_kwargs = template.copy()
+            # Only the expression layout is cached: the values differ on every call.
+            query_kwargs["ExpressionAttributeValues"] = {
+                value_placeholder: to_jsonable_python(partition_key_value)
+            }
+        else:
+            builder = ExpressionBuilder()
 
-        key_condition = builder.build_key_equality(
-            partition_key_attribute, partition_key_value
-        )
+            key_condition = builder.build_key_equality(partition_key_attribute, partition_key_value)
 
-        if sort_key_condition is not None:
-            sk_condition_expr = builder.build_condition_expression(sort_key_condition)
-            key_condition = f"{key_condition} AND {sk_condition_expr}"
+            if sort_key_condition is not None:
+                sk_condition_expr = builder.build_condition_expression(sort_key_condition)
+                key_condition = key_condition + " AND " + sk_condition_expr
 
-        query_kwargs: dict[str, Any] = {
-            "KeyConditionExpression": key_condition,
-            "ConsistentRead": consistent_read,
-        }
+            query_kwargs = {
+                "KeyConditionExpression": key_condition,
+                "ConsistentRead": consistent_read,
+            }
 
-        if index_name is not None:
-            query_kwargs["IndexName"] = index_name
+            if index_name is not None:
+                query_kwargs["IndexName"] = index_name
 
-        if filter_condition is not None:
-            query_kwargs["FilterExpression"] = builder.build_condition_expression(
-                filter_condition
-            )
+            if filter_condition is not None:
+                query_kwargs["FilterExpression"] = builder.build_condition_expression(
+                    filter_condition
+                )
 
-        query_kwargs["ExpressionAttributeNames"] = builder.attribute_names
-        if builder.attribute_values:
-            query_kwargs["ExpressionAttributeValues"] = builder.attribute_values
+            query_kwargs["ExpressionAttributeNames"] = builder.attribute_names
+            if builder.attribute_values:
+                query_kwargs["ExpressionAttributeValues"] = builder.attribute_values
 
         if limit is not None:
             query_kwargs["Limit"] = limit
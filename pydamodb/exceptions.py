@@ -12,6 +12,9 @@ Exception categories:
 - InsufficientConditionsError: Logical condition needs more operands
 - UnknownConditionTypeError: Unsupported condition type
 - EmptyUpdateError: Update operation has no fields
+- UnprocessedItemsError: Batch write items DynamoDB kept refusing
+- UnprocessedKeysError: Batch get keys DynamoDB kept refusing
+- TransactionTooLargeError: Transaction exceeds the DynamoDB item limit
 
 Note: Pydantic validation errors are intentionally not wrapped and will bubble up
 as pydantic.ValidationError since they are well-documented and users likely
@@ -20,6 +23,9 @@ ProvisionedThroughputExceededException) are also not wrapped and come directly
 from boto3/botocore.
 """
 
+from collections.abc import Mapping, Sequence
+from typing import Any
+
 
 class PydamoError(Exception):
     """Base exception for all PydamoDB errors.
@@ -174,6 +180,60 @@ class EmptyUpdateError(PydamoError):
         super().__init__("No updates provided")
 
 
+class UnprocessedItemsError(PydamoError):
+    """Raised when a batch write still has unprocessed items after all retries.
+
+    DynamoDB returns unprocessed items when a BatchWriteItem request is throttled.
+    The batch writer retries them with exponential backoff and raises this error
+    once it gives up.
+
+    Attributes:
+        unprocessed_items: The write requests that were never processed.
+
+    """
+
+    def __init__(self, *, unprocessed_items: Sequence[Mapping[str, Any]]) -> None:
+        self.unprocessed_items = unprocessed_items
+        super().__init__(
+            f"{len(unprocessed_items)} batch write item(s) still unprocessed after retries",
+        )
+
+
+class UnprocessedKeysError(PydamoError):
+    """Raised when a batch get still has unprocessed keys after all retries.
+
+    DynamoDB returns unprocessed keys when a BatchGetItem request is throttled.
+    batch_get retries them with exponential backoff and raises this error once it
+    gives up.
+
+    Attributes:
+        unprocessed_keys: The keys that were never read.
+
+    """
+
+    def __init__(self, *, unprocessed_keys: Sequence[Mapping[str, Any]]) -> None:
+        self.unprocessed_keys = unprocessed_keys
+        super().__init__(
+            f"{len(unprocessed_keys)} batch get key(s) still unprocessed after retries",
+        )
+
+
+class TransactionTooLargeError(PydamoError):
+    """Raised when a transaction would exceed the DynamoDB item limit.
+
+    A TransactWriteItems request accepts at most 100 actions. Writes beyond that
+    cannot be split into another request without losing atomicity.
+
+    Attributes:
+        max_items: The maximum number of writes in a single transaction.
+
+    """
+
+    def __init__(self, *, max_items: int) -> None:
+        self.max_items = max_items
+        super().__init__(f"A transaction cannot contain more than {max_items} writes")
+
+
 __all__ = [
     "EmptyUpdateError",
     "IndexNotFoundError",
@@ -181,5 +241,8 @@ __all__ = [
     "InvalidKeySchemaError",
     "MissingSortKeyValueError",
     "PydamoError",
+    "TransactionTooLargeError",
     "UnknownConditionTypeError",
+    "UnprocessedItemsError",
+    "UnprocessedKeysError",
 ]
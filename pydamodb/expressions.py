@@ -306,7 +306,7 @@ class ExpressionBuilder:
         """
         name_ph = self._get_name_placeholder(field)
         value_ph = self._get_value_placeholder(value)
-        return f"{name_ph} = {value_ph}"
+        return name_ph + " = " + value_ph
 
     def build_condition_expression(self, condition: Condition) -> str:
         """Build a DynamoDB ConditionExpression string from a condition object.
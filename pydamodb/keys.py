@@ -12,17 +12,22 @@ Type aliases:
 
     LastEvaluatedKey: The pagination token returned by query() and scan() operations.
         Pass this to exclusive_start_key to continue pagination. Has the same structure
-        as DynamoDBKey but uses TypeAliasType for better type inference.
+        as DynamoDBKey but uses TypeAliasType for better type inference. At runtime it
+        is plain DynamoDBKey, so no TypeAliasType is constructed on import.
 """
 
 from decimal import Decimal
-from typing import TypeAlias
-
-from typing_extensions import TypeAliasType
+from typing import TYPE_CHECKING, TypeAlias
 
 KeyValue: TypeAlias = str | bytes | bytearray | int | Decimal
 DynamoDBKey: TypeAlias = dict[str, KeyValue]
-LastEvaluatedKey = TypeAliasType("LastEvaluatedKey", DynamoDBKey)
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAliasType
+
+    LastEvaluatedKey = TypeAliasType("LastEvaluatedKey", DynamoDBKey)
+else:
+    LastEvaluatedKey = DynamoDBKey
 
 
 __all__ = [
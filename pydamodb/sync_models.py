@@ -9,8 +9,15 @@ Models are Pydantic `BaseModel` classes, with DynamoDB helpers like save/delete,
 and class-level query/update helpers.
 """
 
+import queue
+import threading
+import time
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from types import TracebackType
-from typing import ClassVar, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 
 from typing_extensions import Self
 
@@ -24,6 +31,8 @@ from pydamodb.base import (
 from pydamodb.conditions import Condition
 from pydamodb.exceptions import (
     IndexNotFoundError,
+    TransactionTooLargeError,
+    UnprocessedItemsError,
 )
 from pydamodb.expressions import UpdateMapping
 from pydamodb.keys import (
@@ -34,13 +43,23 @@ from pydamodb.keys import (
 
 ModelType = TypeVar("ModelType", bound="_SyncPydamoModelBase")
 
+_BATCH_WRITE_MAX_ITEMS = 25
+_BATCH_WRITE_MAX_ATTEMPTS = 10
+_BATCH_WRITE_BACKOFF_BASE = 0.05
+_BACKGROUND_MAX_PENDING_BATCHES = 8
+_TRANSACT_MAX_ITEMS = 100
+
 
 class _ModelBatchWriter(Generic[ModelType]):
     """Context manager for batch writing PydamoDB models to DynamoDB.
 
-    This class wraps boto3's batch_writer to accept PydamoDB model instances
-    instead of raw dictionaries. It automatically handles model serialization
-    and key building based on the model's key schema.
+    This class buffers put and delete requests for PydamoDB model instances and
+    sends them with BatchWriteItem in batches of 25, the DynamoDB limit. Items
+    DynamoDB leaves unprocessed are retried with exponential backoff. Buffering is
+    guarded by a lock, so a writer can be shared between threads.
+
+    In background mode, full batches are handed to a worker thread so put() and
+    delete() do not wait for DynamoDB. The first send error is raised on exit.
 
     Use via Model.batch_writer() context manager for efficient batch operations.
 
@@ -52,17 +71,44 @@ class _ModelBatchWriter(Generic[ModelType]):
 
     """
 
+    __slots__ = (
+        "_client",
+        "_error",
+        "_lock",
+        "_model_cls",
+        "_overwrite_by_pkeys",
+        "_queue",
+        "_requests",
+        "_table_name",
+        "_worker",
+    )
+
     def __init__(
         self,
         model_cls: type[ModelType],
         overwrite_by_pkeys: list[str] | None = None,
+        *,
+        background: bool = False,
     ) -> None:
         self._model_cls = model_cls
-        self._table = model_cls._table()
-        self._writer = self._table.batch_writer(overwrite_by_pkeys=overwrite_by_pkeys or [])
+        table = model_cls._table()
+        self._client = table.meta.client
+        self._table_name = table.name
+        self._overwrite_by_pkeys = overwrite_by_pkeys
+        self._requests: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[list[dict[str, Any]] | None] | None = (
+            queue.Queue(maxsize=_BACKGROUND_MAX_PENDING_BATCHES) if background else None
+        )
+        self._worker: threading.Thread | None = None
+        self._error: Exception | None = None
 
     def __enter__(self) -> Self:
-        self._writer.__enter__()
+        if self._queue is not None:
+            self._worker = threading.Thread(
+                target=self._send_queued, args=(self._queue,), daemon=True
+            )
+            self._worker.start()
         return self
 
     def __exit__(
@@ -71,19 +117,128 @@ class _ModelBatchWriter(Generic[ModelType]):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        self._writer.__exit__(exc_type, exc_val, exc_tb)
+        while True:
+            with self._lock:
+                batch = self._take_batch()
+            if not batch:
+                break
+            self._flush(batch)
+        if self._queue is not None and self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            # An exception from the with block takes precedence over a send error.
+            if self._error is not None and exc_type is None:
+                raise self._error
 
     def put(self, model: ModelType) -> None:
         """Put a model instance using the batch writer."""
-        self._writer.put_item(Item=model.model_dump(mode="json"))
+        self._add_request({"PutRequest": {"Item": model._dump_item()}})
 
     def delete(self, model: ModelType) -> None:
         """Delete a model instance using the batch writer."""
-        key = self._model_cls._build_dynamodb_key(
-            partition_key_value=model._partition_key_value,
-            sort_key_value=model._sort_key_value,
-        )
-        self._writer.delete_item(Key=key)
+        key = model._item_key()
+        self._add_request({"DeleteRequest": {"Key": key}})
+
+    def _add_request(self, request: dict[str, Any]) -> None:
+        with self._lock:
+            if self._overwrite_by_pkeys:
+                pkey_values = self._pkey_values(request)
+                self._requests = [
+                    buffered
+                    for buffered in self._requests
+                    if self._pkey_values(buffered) != pkey_values
+                ]
+            self._requests.append(request)
+            if len(self._requests) < _BATCH_WRITE_MAX_ITEMS:
+                return
+            batch = self._take_batch()
+        self._flush(batch)
+
+    def _pkey_values(self, request: dict[str, Any]) -> list[Any]:
+        if "PutRequest" in request:
+            attributes = request["PutRequest"]["Item"]
+        else:
+            attributes = request["DeleteRequest"]["Key"]
+        return [attributes[name] for name in self._overwrite_by_pkeys or ()]
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        """Take the next batch off the buffer. The caller must hold the lock."""
+        batch = self._requests[:_BATCH_WRITE_MAX_ITEMS]
+        del self._requests[:_BATCH_WRITE_MAX_ITEMS]
+        return batch
+
+    def _flush(self, batch: list[dict[str, Any]]) -> None:
+        """Send a batch, or queue it in background mode. Called without the lock held."""
+        if self._queue is not None and self._worker is not None:
+            # Blocks once too many batches are pending, so producers cannot outrun DynamoDB.
+            self._queue.put(batch)
+        else:
+            self._send(batch)
+
+    def _send_queued(self, pending: queue.Queue[list[dict[str, Any]] | None]) -> None:
+        """Send queued batches until the None sentinel, stopping at the first error.
+
+        After a failure the remaining batches are drained unsent, so producers blocked
+        on the full queue are released and the first error is the one raised.
+        """
+        while (batch := pending.get()) is not None:
+            if self._error is not None:
+                continue
+            try:
+                self._send(batch)
+            except Exception as error:  # noqa: BLE001 - re-raised by __exit__
+                self._error = error
+
+    def _send(self, batch: list[Any]) -> None:
+        """Send a batch, retrying unprocessed items with exponential backoff.
+
+        Raises:
+            UnprocessedItemsError: If items are still unprocessed after the last attempt.
+
+        """
+        for attempt in range(_BATCH_WRITE_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(_BATCH_WRITE_BACKOFF_BASE * 2 ** (attempt - 1))
+            response = self._client.batch_write_item(RequestItems={self._table_name: batch})
+            batch = response.get("UnprocessedItems", {}).get(self._table_name, [])
+            if not batch:
+                return
+        raise UnprocessedItemsError(unprocessed_items=batch)
+
+
+class _ModelTransaction:
+    """Write actions collected by Model.transaction(), sent with TransactWriteItems."""
+
+    __slots__ = ("_client", "_items")
+
+    def __init__(self) -> None:
+        self._client: Any = None
+        self._items: list[dict[str, Any]] = []
+
+    def add(self, table: SyncTable, action: str, kwargs: dict[str, Any]) -> None:
+        if len(self._items) >= _TRANSACT_MAX_ITEMS:
+            raise TransactionTooLargeError(max_items=_TRANSACT_MAX_ITEMS)
+        if self._client is None:
+            self._client = table.meta.client
+        self._items.append({action: {"TableName": table.name, **kwargs}})
+
+    def commit(self) -> None:
+        if self._items:
+            self._client.transact_write_items(TransactItems=self._items)
+
+
+_active_transaction: ContextVar[_ModelTransaction | None] = ContextVar(
+    "pydamodb_active_transaction", default=None
+)
+
+
+def _enqueue_transaction_write(table: SyncTable, action: str, kwargs: dict[str, Any]) -> bool:
+    """Add a write to the active transaction, if any. Returns whether it was added."""
+    transaction = _active_transaction.get()
+    if transaction is None:
+        return False
+    transaction.add(table, action, kwargs)
+    return True
 
 
 class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
@@ -102,16 +257,30 @@ class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
     """
 
     pydamo_config: ClassVar[PydamoConfig[SyncTable]]
+    # Cached per table object, so re-pointing pydamo_config at another table reloads them.
+    _table_key_schema: ClassVar[tuple[SyncTable, list[KeySchema]] | None] = None
+    _table_index_key_attributes: ClassVar[
+        tuple[SyncTable, dict[str, tuple[str, str | None]]] | None
+    ] = None
 
     @classmethod
     def _key_schema(cls) -> list[KeySchema]:
-        """Get key schema, auto-loading from table if not cached."""
-        return cls._table().key_schema
+        """Get key schema, loading it from the table once per table object."""
+        table = cls._table()
+        cached = cls._table_key_schema
+        if cached is not None and cached[0] is table:
+            return cached[1]
+
+        key_schema = table.key_schema
+        cls._table_key_schema = (table, key_schema)
+        return key_schema
 
     @classmethod
     def batch_writer(
         cls,
         overwrite_by_pkeys: list[str] | None = None,
+        *,
+        background: bool = False,
     ) -> _ModelBatchWriter[Self]:
         """Return a batch writer that works with PydamoDB models.
 
@@ -119,6 +288,8 @@ class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
             overwrite_by_pkeys: List of partition key attribute names to use for
                 de-duplication within the batch. If multiple items with the same
                 partition key are added to the batch, only the last one will be written.
+            background: Send full batches from a worker thread instead of the caller's.
+                Send errors are then raised when the writer exits.
 
         Example:
             with User.batch_writer() as writer:
@@ -127,7 +298,43 @@ class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
                 writer.delete(User(id="3", name="Bart"))
 
         """
-        return _ModelBatchWriter(cls, overwrite_by_pkeys=overwrite_by_pkeys)
+        return _ModelBatchWriter(cls, overwrite_by_pkeys=overwrite_by_pkeys, background=background)
+
+    @classmethod
+    @contextmanager
+    def transaction(cls) -> Generator[None, None, None]:
+        """Group writes into a single atomic TransactWriteItems request.
+
+        Inside the block, save, update and delete calls on any sync model are
+        collected instead of being sent. They are sent together when the block
+        exits without an exception, and discarded otherwise. Nested blocks join
+        the outermost transaction.
+
+        Raises:
+            TransactionTooLargeError: If more than 100 writes are collected.
+
+        Note:
+            A failed condition cancels the whole transaction and surfaces as
+            botocore's TransactionCanceledException rather than
+            ConditionalCheckFailedException.
+
+        Example:
+            with Order.transaction():
+                order.save()
+                Inventory.update_item("sku-1", updates={Inventory.attr("stock"): 4})
+
+        """
+        if _active_transaction.get() is not None:
+            yield
+            return
+
+        transaction = _ModelTransaction()
+        token = _active_transaction.set(transaction)
+        try:
+            yield
+        finally:
+            _active_transaction.reset(token)
+        transaction.commit()
 
     @classmethod
     def _get_index_key_attributes(cls, *, index_name: str) -> tuple[str, str | None]:
@@ -145,24 +352,19 @@ class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
 
         """
         table = cls._table()
+        cached = cls._table_index_key_attributes
+        if cached is not None and cached[0] is table:
+            index_key_attributes = cached[1]
+        else:
+            index_key_attributes = cls._parse_index_key_attributes(
+                (*(table.global_secondary_indexes or []), *(table.local_secondary_indexes or []))
+            )
+            cls._table_index_key_attributes = (table, index_key_attributes)
 
-        # Check GSIs
-        gsis = table.global_secondary_indexes or []
-        for gsi in gsis:
-            if gsi.get("IndexName") == index_name:
-                key_schema = gsi.get("KeySchema")
-                if key_schema is not None:
-                    return cls._parse_key_schema(key_schema=key_schema)
-
-        # Check LSIs
-        lsis = table.local_secondary_indexes or []
-        for lsi in lsis:
-            if lsi.get("IndexName") == index_name:
-                key_schema = lsi.get("KeySchema")
-                if key_schema is not None:
-                    return cls._parse_key_schema(key_schema=key_schema)
-
-        raise IndexNotFoundError(index_name=index_name)
+        try:
+            return index_key_attributes[index_name]
+        except KeyError:
+            raise IndexNotFoundError(index_name=index_name) from None
 
     def save(self, *, condition: Condition | None = None) -> None:
         """Save the model to DynamoDB.
@@ -177,7 +379,8 @@ class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
         table = self._table()
         put_kwargs = self._build_put_kwargs(condition=condition)
 
-        table.put_item(**put_kwargs)
+        if not _enqueue_transaction_write(table, "Put", put_kwargs):
+            table.put_item(**put_kwargs)
 
     @classmethod
     def _update_item_key(
@@ -201,7 +404,8 @@ class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
         table = cls._table()
         update_kwargs = cls._build_update_kwargs(key=key, updates=updates, condition=condition)
 
-        table.update_item(**update_kwargs)
+        if not _enqueue_transaction_write(table, "Update", update_kwargs):
+            table.update_item(**update_kwargs)
 
     @classmethod
     def _delete_item_key(cls, *, key: DynamoDBKey, condition: Condition | None = None) -> None:
@@ -218,7 +422,8 @@ class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
         table = cls._table()
         delete_kwargs = cls._build_delete_kwargs(key=key, condition=condition)
 
-        table.delete_item(**delete_kwargs)
+        if not _enqueue_transaction_write(table, "Delete", delete_kwargs):
+            table.delete_item(**delete_kwargs)
 
     @classmethod
     def _get_item_key(
@@ -244,7 +449,7 @@ class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
         if item is None:
             return None
 
-        return cls.model_validate(item)
+        return cls._from_item(item)
 
     def delete(self, *, condition: Condition | None = None) -> None:
         """Delete this item from DynamoDB.
@@ -256,10 +461,7 @@ class _SyncPydamoModelBase(_PydamoModelBase[SyncTable]):
             ConditionCheckFailedError: If the condition is not satisfied.
 
         """
-        key = self._build_dynamodb_key(
-            partition_key_value=self._partition_key_value,
-            sort_key_value=self._sort_key_value,
-        )
+        key = self._item_key()
         self._delete_item_key(key=key, condition=condition)
 
 
@@ -305,7 +507,7 @@ class PrimaryKeyModel(_SyncPydamoModelBase):
             The model instance if found, None otherwise.
 
         """
-        key = cls._build_dynamodb_key(partition_key_value=partition_key_value)
+        key = cls._key_builder()(partition_key_value, None)
         return cls._get_item_key(key=key, consistent_read=consistent_read)
 
     @classmethod
@@ -330,7 +532,7 @@ class PrimaryKeyModel(_SyncPydamoModelBase):
             User.update_item("user-123", updates={User.attr("name"): "New Name"})
 
         """
-        key = cls._build_dynamodb_key(partition_key_value=partition_key_value)
+        key = cls._key_builder()(partition_key_value, None)
         cls._update_item_key(key=key, updates=updates, condition=condition)
 
     @classmethod
@@ -354,7 +556,7 @@ class PrimaryKeyModel(_SyncPydamoModelBase):
             User.delete_item("user-123", condition=User.attr("status") == "inactive")
 
         """
-        key = cls._build_dynamodb_key(partition_key_value=partition_key_value)
+        key = cls._key_builder()(partition_key_value, None)
         cls._delete_item_key(key=key, condition=condition)
 
 
@@ -403,10 +605,7 @@ class PrimaryKeyAndSortKeyModel(_SyncPydamoModelBase):
             The model instance if found, None otherwise.
 
         """
-        key = cls._build_dynamodb_key(
-            partition_key_value=partition_key_value,
-            sort_key_value=sort_key_value,
-        )
+        key = cls._key_builder()(partition_key_value, sort_key_value)
         return cls._get_item_key(key=key, consistent_read=consistent_read)
 
     @classmethod
@@ -435,10 +634,7 @@ class PrimaryKeyAndSortKeyModel(_SyncPydamoModelBase):
             )
 
         """
-        key = cls._build_dynamodb_key(
-            partition_key_value=partition_key_value,
-            sort_key_value=sort_key_value,
-        )
+        key = cls._key_builder()(partition_key_value, sort_key_value)
         cls._update_item_key(key=key, updates=updates, condition=condition)
 
     @classmethod
@@ -463,10 +659,7 @@ class PrimaryKeyAndSortKeyModel(_SyncPydamoModelBase):
             Order.delete_item("user-123", "order-456")
 
         """
-        key = cls._build_dynamodb_key(
-            partition_key_value=partition_key_value,
-            sort_key_value=sort_key_value,
-        )
+        key = cls._key_builder()(partition_key_value, sort_key_value)
         cls._delete_item_key(key=key, condition=condition)
 
     @classmethod
@@ -542,13 +735,10 @@ class PrimaryKeyAndSortKeyModel(_SyncPydamoModelBase):
 
         response = table.query(**query_kwargs)
 
-        items = [cls.model_validate(item) for item in response.get("Items", [])]
+        items = cls._from_items(response.get("Items") or ())
         last_evaluated_key: LastEvaluatedKey | None = response.get("LastEvaluatedKey")  # ty: ignore[invalid-assignment]
 
-        return QueryResult(
-            items=items,
-            last_evaluated_key=last_evaluated_key,
-        )
+        return QueryResult(items, last_evaluated_key)
 
     @classmethod
     def query_all(
@@ -562,8 +752,10 @@ class PrimaryKeyAndSortKeyModel(_SyncPydamoModelBase):
     ) -> list[Self]:
         """Query all items matching the partition key, handling pagination automatically.
 
-        This method repeatedly calls query() until all matching items are retrieved.
-        Use this when you need all results and don't want to handle pagination manually.
+        This method keeps querying until all matching items are retrieved. When there
+        is more than one page, the next page is requested on a worker thread while the
+        current one is validated, so network time overlaps with validation. Use this
+        when you need all results and don't want to handle pagination manually.
 
         Args:
             partition_key_value: The partition key value to query. When querying an
@@ -591,22 +783,45 @@ class PrimaryKeyAndSortKeyModel(_SyncPydamoModelBase):
             )
 
         """
-        all_items: list[Self] = []
-        last_key: LastEvaluatedKey | None = None
+        table = cls._table()
+        # Pages are fetched through the resource's client: unlike the resource,
+        # boto3 clients are safe to use from the prefetch thread.
+        client = table.meta.client
 
-        while True:
-            items, last_key = cls.query(
+        if index_name is not None:
+            pk_attr, _ = cls._get_index_key_attributes(index_name=index_name)
+        else:
+            pk_attr = cls._partition_key_attribute()
+
+        def fetch_page(exclusive_start_key: LastEvaluatedKey | None) -> Any:
+            # Kwargs are rebuilt per page, since each page has its own ExclusiveStartKey.
+            query_kwargs = cls._build_query_kwargs(
+                partition_key_attribute=pk_attr,
                 partition_key_value=partition_key_value,
                 sort_key_condition=sort_key_condition,
                 filter_condition=filter_condition,
+                limit=None,
                 consistent_read=consistent_read,
-                exclusive_start_key=last_key,
+                exclusive_start_key=exclusive_start_key,
                 index_name=index_name,
             )
-            all_items.extend(items)
-
-            if last_key is None:
-                break
+            return client.query(TableName=table.name, **query_kwargs)
+
+        response = fetch_page(None)
+        all_items = cls._from_items(response.get("Items") or ())
+        last_key = response.get("LastEvaluatedKey")
+        if last_key is None:
+            return all_items
+
+        # Only multi-page results pay for the worker thread.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page: Future[Any] | None = executor.submit(fetch_page, last_key)
+            while next_page is not None:
+                response = next_page.result()
+                last_key = response.get("LastEvaluatedKey")
+                # Request the next page before validating this one.
+                next_page = executor.submit(fetch_page, last_key) if last_key is not None else None
+                all_items.extend(cls._from_items(response.get("Items") or ()))
 
         return all_items
 
@@ -1,10 +1,13 @@
 from collections.abc import AsyncGenerator, Generator
 from os import environ
+from typing import Any
+from uuid import uuid4
 
 import aioboto3
 import boto3
+from aiobotocore.config import AioConfig
 from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource, Table
-from pytest import fixture
+from pytest import FixtureRequest, fixture
 from pytest_asyncio import fixture as async_fixture
 from testcontainers.core.container import (
     DockerContainer,
@@ -18,262 +21,220 @@ from types_aiobotocore_dynamodb.service_resource import (
 )
 
 
+def _truncate_table(table: Table) -> None:
+    """Delete every item, so a session-scoped table starts each test empty."""
+    key_names = [key["AttributeName"] for key in table.key_schema]
+    scan_kwargs: dict[str, Any] = {
+        "ProjectionExpression": ", ".join(f"#k{i}" for i in range(len(key_names))),
+        "ExpressionAttributeNames": {f"#k{i}": name for i, name in enumerate(key_names)},
+    }
+    with table.batch_writer(overwrite_by_pkeys=key_names) as writer:
+        while True:
+            response = table.scan(**scan_kwargs)
+            for key in response["Items"]:
+                writer.delete_item(Key=key)
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
 @fixture(scope="session", autouse=True)
 def aws_credentials() -> None:
-    environ["AWS_ACCESS_KEY_ID"] = "testing"
-    environ["AWS_SECRET_ACCESS_KEY"] = "testing"  # noqa: S105
-    environ["AWS_SECURITY_TOKEN"] = "testing"  # noqa: S105
-    environ["AWS_SESSION_TOKEN"] = "testing"  # noqa: S105
-    environ["AWS_DEFAULT_REGION"] = "us-east-1"
+    environ.update(
+        {
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "AWS_SECURITY_TOKEN": "testing",
+            "AWS_SESSION_TOKEN": "testing",
+            "AWS_DEFAULT_REGION": "us-east-1",
+        }
+    )
 
 
 @fixture(scope="session")
-def dynamodb(aws_credentials: None) -> Generator[DynamoDBServiceResource, None, None]:
+def dynamodb_endpoint(aws_credentials: None) -> Generator[str, None, None]:
+    """Session-scoped dynamodb-local container shared by the sync and async suites."""
     with DockerContainer(
         "amazon/dynamodb-local:latest",
         ports=[8000],
         _wait_strategy=HttpWaitStrategy(8000).for_status_code(400),
     ) as container:
-        dynamodb = boto3.resource(
-            "dynamodb", endpoint_url=f"http://localhost:{container.get_exposed_port(8000)}"
+        yield f"http://localhost:{container.get_exposed_port(8000)}"
+
+
+@fixture(scope="session")
+def dynamodb(dynamodb_endpoint: str) -> DynamoDBServiceResource:
+    return boto3.resource("dynamodb", endpoint_url=dynamodb_endpoint)
+
+
+# Keep connections to the endpoint open between the many sequential async calls.
+_ASYNC_CLIENT_CONFIG = AioConfig(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=10,
+    connector_args={"keepalive_timeout": 30},
+)
+
+
+_PK_TABLE: dict[str, Any] = {
+    "KeySchema": [
+        {"AttributeName": "id", "KeyType": "HASH"},
+    ],
+    "AttributeDefinitions": [
+        {"AttributeName": "id", "AttributeType": "S"},
+    ],
+}
+
+_PK_SK_TABLE: dict[str, Any] = {
+    "KeySchema": [
+        {"AttributeName": "id", "KeyType": "HASH"},
+        {"AttributeName": "sort", "KeyType": "RANGE"},
+    ],
+    "AttributeDefinitions": [
+        {"AttributeName": "id", "AttributeType": "S"},
+        {"AttributeName": "sort", "AttributeType": "S"},
+    ],
+}
+
+# PK+SK with a GSI on the 'status' attribute.
+_PK_SK_TABLE_WITH_GSI: dict[str, Any] = {
+    "KeySchema": _PK_SK_TABLE["KeySchema"],
+    "AttributeDefinitions": [
+        *_PK_SK_TABLE["AttributeDefinitions"],
+        {"AttributeName": "status", "AttributeType": "S"},
+    ],
+    "GlobalSecondaryIndexes": [
+        {
+            "IndexName": "status-index",
+            "KeySchema": [
+                {"AttributeName": "status", "KeyType": "HASH"},
+            ],
+            "Projection": {"ProjectionType": "ALL"},
+        },
+    ],
+}
+
+# PK+SK with an LSI sorting on 'created_at'.
+_PK_SK_TABLE_WITH_LSI: dict[str, Any] = {
+    "KeySchema": _PK_SK_TABLE["KeySchema"],
+    "AttributeDefinitions": [
+        *_PK_SK_TABLE["AttributeDefinitions"],
+        {"AttributeName": "created_at", "AttributeType": "S"},
+    ],
+    "LocalSecondaryIndexes": [
+        {
+            "IndexName": "created-at-index",
+            "KeySchema": [
+                {"AttributeName": "id", "KeyType": "HASH"},
+                {"AttributeName": "created_at", "KeyType": "RANGE"},
+            ],
+            "Projection": {"ProjectionType": "ALL"},
+        },
+    ],
+}
+
+
+def _session_table_fixture(name: str, table_name: str, definition: dict[str, Any]) -> Any:
+    """Build a session-scoped fixture that creates a table once.
+
+    dynamodb-local creates tables synchronously, so the new table is checked once
+    instead of polled with a waiter. Names get a random suffix so runs sharing an
+    endpoint (e.g. pytest-xdist workers) never collide; tests use ``table.name``.
+    Tables are not deleted: they go away with the container at the end of the session.
+    """
+
+    @fixture(scope="session", name=name)
+    def session_table(dynamodb: DynamoDBServiceResource) -> Table:
+        table = dynamodb.create_table(
+            TableName=f"{table_name}-{uuid4().hex[:8]}",
+            BillingMode="PAY_PER_REQUEST",
+            **definition,
         )
-        yield dynamodb
+        assert table.table_status == "ACTIVE"
+        return table
 
+    return session_table
 
-@fixture
-def pk_table(dynamodb: DynamoDBServiceResource) -> Generator[Table, None, None]:
-    table = dynamodb.create_table(
-        TableName="PKTable",
-        KeySchema=[
-            {"AttributeName": "id", "KeyType": "HASH"},
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-    table.wait_until_exists()
-
-    yield table
-
-    table.delete()
-
-
-@fixture
-def pk_sk_table(dynamodb: DynamoDBServiceResource) -> Generator[Table, None, None]:
-    table = dynamodb.create_table(
-        TableName="PKSKTable",
-        KeySchema=[
-            {"AttributeName": "id", "KeyType": "HASH"},
-            {"AttributeName": "sort", "KeyType": "RANGE"},
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "sort", "AttributeType": "S"},
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-    table.wait_until_exists()
-
-    yield table
-
-    table.delete()
-
-
-@fixture
-def pk_sk_table_with_gsi(dynamodb: DynamoDBServiceResource) -> Generator[Table, None, None]:
-    """Table with PK+SK and a GSI on 'status' attribute."""
-    table = dynamodb.create_table(
-        TableName="PKSKTableWithGSI",
-        KeySchema=[
-            {"AttributeName": "id", "KeyType": "HASH"},
-            {"AttributeName": "sort", "KeyType": "RANGE"},
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "sort", "AttributeType": "S"},
-            {"AttributeName": "status", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "status-index",
-                "KeySchema": [
-                    {"AttributeName": "status", "KeyType": "HASH"},
-                ],
-                "Projection": {"ProjectionType": "ALL"},
-            },
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-    table.wait_until_exists()
-
-    yield table
-
-    table.delete()
-
-
-@fixture
-def pk_sk_table_with_lsi(dynamodb: DynamoDBServiceResource) -> Generator[Table, None, None]:
-    table = dynamodb.create_table(
-        TableName="PKSKTableWithLSI",
-        KeySchema=[
-            {"AttributeName": "id", "KeyType": "HASH"},
-            {"AttributeName": "sort", "KeyType": "RANGE"},
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "sort", "AttributeType": "S"},
-            {"AttributeName": "created_at", "AttributeType": "S"},
-        ],
-        LocalSecondaryIndexes=[
-            {
-                "IndexName": "created-at-index",
-                "KeySchema": [
-                    {"AttributeName": "id", "KeyType": "HASH"},
-                    {"AttributeName": "created_at", "KeyType": "RANGE"},
-                ],
-                "Projection": {"ProjectionType": "ALL"},
-            },
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-    table.wait_until_exists()
 
-    yield table
+def _table_fixture(name: str, session_name: str) -> Any:
+    """Build a fixture handing out a session table and emptying it after each test."""
 
-    table.delete()
+    @fixture(name=name)
+    def table_fixture(request: FixtureRequest) -> Generator[Table, None, None]:
+        table: Table = request.getfixturevalue(session_name)
+        yield table
+        _truncate_table(table)
 
+    return table_fixture
 
-# Async fixtures
 
+def _async_table_fixture(name: str, session_name: str) -> Any:
+    """Build a fixture opening a session table on the shared aioboto3 resource."""
 
-@fixture(scope="session")
-def async_dynamodb_endpoint(aws_credentials: None) -> Generator[str, None, None]:
-    """Session-scoped Docker container providing endpoint URL for async tests."""
-    with DockerContainer(
-        "amazon/dynamodb-local:latest",
-        ports=[8000],
-        _wait_strategy=HttpWaitStrategy(8000).for_status_code(400),
-    ) as container:
-        yield f"http://localhost:{container.get_exposed_port(8000)}"
+    @async_fixture(name=name)
+    async def async_table_fixture(
+        request: FixtureRequest, async_dynamodb: AsyncDynamoDBServiceResource
+    ) -> AsyncGenerator[AsyncTable, None]:
+        table: Table = request.getfixturevalue(session_name)
+        yield await async_dynamodb.Table(table.name)
+        _truncate_table(table)
+
+    return async_table_fixture
+
+
+# Tables are created once per session; the function-scoped fixtures empty them after
+# each test instead of deleting and recreating them. The async tables live in the same
+# container under their own names and are created through the sync resource, outside
+# any test's event loop.
+
+_pk_table = _session_table_fixture("_pk_table", "PKTable", _PK_TABLE)
+_pk_sk_table = _session_table_fixture("_pk_sk_table", "PKSKTable", _PK_SK_TABLE)
+_pk_sk_table_with_gsi = _session_table_fixture(
+    "_pk_sk_table_with_gsi", "PKSKTableWithGSI", _PK_SK_TABLE_WITH_GSI
+)
+_pk_sk_table_with_lsi = _session_table_fixture(
+    "_pk_sk_table_with_lsi", "PKSKTableWithLSI", _PK_SK_TABLE_WITH_LSI
+)
+_async_pk_table = _session_table_fixture("_async_pk_table", "AsyncPKTable", _PK_TABLE)
+_async_pk_sk_table = _session_table_fixture("_async_pk_sk_table", "AsyncPKSKTable", _PK_SK_TABLE)
+_async_pk_sk_table_with_gsi = _session_table_fixture(
+    "_async_pk_sk_table_with_gsi", "AsyncPKSKTableWithGSI", _PK_SK_TABLE_WITH_GSI
+)
+_async_pk_sk_table_with_lsi = _session_table_fixture(
+    "_async_pk_sk_table_with_lsi", "AsyncPKSKTableWithLSI", _PK_SK_TABLE_WITH_LSI
+)
+
+pk_table = _table_fixture("pk_table", "_pk_table")
+pk_sk_table = _table_fixture("pk_sk_table", "_pk_sk_table")
+pk_sk_table_with_gsi = _table_fixture("pk_sk_table_with_gsi", "_pk_sk_table_with_gsi")
+pk_sk_table_with_lsi = _table_fixture("pk_sk_table_with_lsi", "_pk_sk_table_with_lsi")
 
 
-@async_fixture
+# Async fixtures
+
+
+@async_fixture(scope="session")
 async def async_dynamodb(
-    async_dynamodb_endpoint: str,
+    dynamodb_endpoint: str,
 ) -> AsyncGenerator[AsyncDynamoDBServiceResource, None]:
-    """Function-scoped aioboto3 resource reusing session-scoped endpoint."""
+    """Session-scoped aioboto3 resource, so async tests share one client and its connections.
+
+    Async tests and fixtures all run on the session event loop (see ``[tool.pytest]``
+    in pyproject.toml); the client is bound to the loop it was entered on.
+    """
     session = aioboto3.Session()
-    async with session.resource("dynamodb", endpoint_url=async_dynamodb_endpoint) as dynamodb:
+    async with session.resource(
+        "dynamodb", endpoint_url=dynamodb_endpoint, config=_ASYNC_CLIENT_CONFIG
+    ) as dynamodb:
         yield dynamodb
 
 
-@async_fixture
-async def async_pk_table(
-    async_dynamodb: AsyncDynamoDBServiceResource,
-) -> AsyncGenerator[AsyncTable, None]:
-    table = await async_dynamodb.create_table(
-        TableName="AsyncPKTable",
-        KeySchema=[
-            {"AttributeName": "id", "KeyType": "HASH"},
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-    await table.wait_until_exists()
-
-    yield table
-
-    await table.delete()
-
-
-@async_fixture
-async def async_pk_sk_table(
-    async_dynamodb: AsyncDynamoDBServiceResource,
-) -> AsyncGenerator[AsyncTable, None]:
-    table = await async_dynamodb.create_table(
-        TableName="AsyncPKSKTable",
-        KeySchema=[
-            {"AttributeName": "id", "KeyType": "HASH"},
-            {"AttributeName": "sort", "KeyType": "RANGE"},
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "sort", "AttributeType": "S"},
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-    await table.wait_until_exists()
-
-    yield table
-
-    await table.delete()
-
-
-@async_fixture
-async def async_pk_sk_table_with_gsi(
-    async_dynamodb: AsyncDynamoDBServiceResource,
-) -> AsyncGenerator[AsyncTable, None]:
-    table = await async_dynamodb.create_table(
-        TableName="AsyncPKSKTableWithGSI",
-        KeySchema=[
-            {"AttributeName": "id", "KeyType": "HASH"},
-            {"AttributeName": "sort", "KeyType": "RANGE"},
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "sort", "AttributeType": "S"},
-            {"AttributeName": "status", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "status-index",
-                "KeySchema": [
-                    {"AttributeName": "status", "KeyType": "HASH"},
-                ],
-                "Projection": {"ProjectionType": "ALL"},
-            },
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-    await table.wait_until_exists()
-
-    yield table
-
-    await table.delete()
-
-
-@async_fixture
-async def async_pk_sk_table_with_lsi(
-    async_dynamodb: AsyncDynamoDBServiceResource,
-) -> AsyncGenerator[AsyncTable, None]:
-    table = await async_dynamodb.create_table(
-        TableName="AsyncPKSKTableWithLSI",
-        KeySchema=[
-            {"AttributeName": "id", "KeyType": "HASH"},
-            {"AttributeName": "sort", "KeyType": "RANGE"},
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "sort", "AttributeType": "S"},
-            {"AttributeName": "created_at", "AttributeType": "S"},
-        ],
-        LocalSecondaryIndexes=[
-            {
-                "IndexName": "created-at-index",
-                "KeySchema": [
-                    {"AttributeName": "id", "KeyType": "HASH"},
-                    {"AttributeName": "created_at", "KeyType": "RANGE"},
-                ],
-                "Projection": {"ProjectionType": "ALL"},
-            },
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-    await table.wait_until_exists()
-
-    yield table
-
-    await table.delete()
+async_pk_table = _async_table_fixture("async_pk_table", "_async_pk_table")
+async_pk_sk_table = _async_table_fixture("async_pk_sk_table", "_async_pk_sk_table")
+async_pk_sk_table_with_gsi = _async_table_fixture(
+    "async_pk_sk_table_with_gsi", "_async_pk_sk_table_with_gsi"
+)
+async_pk_sk_table_with_lsi = _async_table_fixture(
+    "async_pk_sk_table_with_lsi", "_async_pk_sk_table_with_lsi"
+)
@@ -1111,3 +1111,71 @@ async def test_async_pk_sk_model_update_item_with_condition_fails(
     fetched = await AsyncPKSKModel.get_item(async_pk_sk_model.id, async_pk_sk_model.sort)
     assert fetched is not None
     assert fetched.name == async_pk_sk_model.name
+
+
+@pytest.mark.asyncio
+async def test_async_pk_model_batch_get(async_pk_table: AsyncTable) -> None:
+    """batch_get returns existing items across several BatchGetItem chunks."""
+    AsyncPKModel.pydamo_config = PydamoConfig(table=async_pk_table)
+    async with AsyncPKModel.batch_writer() as writer:
+        for i in range(150):
+            await writer.put(AsyncPKModel(id=f"item-{i}", name=f"Item {i}"))
+
+    ids = [f"item-{i}" for i in range(150)]
+    items = await AsyncPKModel.batch_get([*ids, "item-0", "missing"])
+
+    assert sorted(item.id for item in items) == sorted(ids)
+
+
+@pytest.mark.asyncio
+async def test_async_pk_sk_model_batch_get(async_pk_sk_model: AsyncPKSKModel) -> None:
+    """batch_get fetches composite keys and omits missing items."""
+    await async_pk_sk_model.save()
+    other = AsyncPKSKModel(id=async_pk_sk_model.id, sort="other_sort", name="Other")
+    await other.save()
+
+    items = await AsyncPKSKModel.batch_get(
+        [
+            (async_pk_sk_model.id, async_pk_sk_model.sort),
+            (other.id, other.sort),
+            (async_pk_sk_model.id, "missing"),
+        ],
+        consistent_read=True,
+    )
+
+    assert sorted(items, key=lambda item: item.sort) == [other, async_pk_sk_model]
+
+
+@pytest.mark.asyncio
+async def test_async_pk_sk_model_iter_all_follows_pages(async_pk_sk_table: AsyncTable) -> None:
+    """iter_all streams every item across 1 MB query pages, in sort key order."""
+    AsyncPKSKModel.pydamo_config = PydamoConfig(table=async_pk_sk_table)
+    # 30 items of ~40 KB each exceed the 1 MB query page size, forcing pagination.
+    async with AsyncPKSKModel.batch_writer() as writer:
+        for i in range(30):
+            await writer.put(AsyncPKSKModel(id="user-1", sort=f"order-{i:02}", name="x" * 40_000))
+
+    sorts = [item.sort async for item in AsyncPKSKModel.iter_all("user-1")]
+
+    assert sorts == [f"order-{i:02}" for i in range(30)]
+
+
+@pytest.mark.asyncio
+async def test_async_pk_sk_model_iter_all_with_sort_key_condition(
+    async_pk_sk_table: AsyncTable,
+) -> None:
+    """iter_all applies the sort key condition."""
+    AsyncPKSKModel.pydamo_config = PydamoConfig(table=async_pk_sk_table)
+    await AsyncPKSKModel(id="user-1", sort="2024-01", name="Jan").save()
+    await AsyncPKSKModel(id="user-1", sort="2024-02", name="Feb").save()
+    await AsyncPKSKModel(id="user-1", sort="2023-12", name="Dec").save()
+
+    names = [
+        item.name
+        async for item in AsyncPKSKModel.iter_all(
+            "user-1",
+            sort_key_condition=AsyncPKSKModel.attr("sort").begins_with("2024-"),
+        )
+    ]
+
+    assert names == ["Jan", "Feb"]
@@ -851,3 +851,73 @@ def test_pk_sk_model_update_item_with_condition_fails(pk_sk_model: PKSKModel) ->
     fetched = PKSKModel.get_item(pk_sk_model.id, pk_sk_model.sort)
     assert fetched is not None
     assert fetched.name == pk_sk_model.name
+
+
+def test_transaction_writes_to_two_tables_on_exit(
+    pk_model: PKModel, pk_sk_model: PKSKModel
+) -> None:
+    """Saves on two tables are sent together when the block exits."""
+    with PKModel.transaction():
+        pk_model.save()
+        pk_sk_model.save()
+        assert PKModel.get_item(pk_model.id) is None
+
+    assert PKModel.get_item(pk_model.id) == pk_model
+    assert PKSKModel.get_item(pk_sk_model.id, pk_sk_model.sort) == pk_sk_model
+
+
+def test_transaction_conditional_update_and_delete(
+    pk_model: PKModel, pk_sk_model: PKSKModel
+) -> None:
+    """A conditional update and a delete on another table commit atomically."""
+    pk_model.save()
+    pk_sk_model.save()
+
+    with PKModel.transaction():
+        PKModel.update_item(
+            pk_model.id,
+            updates={PKModel.attr("name"): "Updated Name"},
+            condition=PKModel.attr("name") == pk_model.name,
+        )
+        pk_sk_model.delete()
+
+    fetched = PKModel.get_item(pk_model.id)
+    assert fetched is not None
+    assert fetched.name == "Updated Name"
+    assert PKSKModel.get_item(pk_sk_model.id, pk_sk_model.sort) is None
+
+
+def test_transaction_failed_condition_cancels_every_write(
+    pk_model: PKModel, pk_sk_model: PKSKModel
+) -> None:
+    """A failed condition cancels the whole transaction."""
+    pk_model.save()
+
+    with (
+        pytest.raises(PKModel._table().meta.client.exceptions.TransactionCanceledException),
+        PKModel.transaction(),
+    ):
+        pk_sk_model.save()
+        PKModel.update_item(
+            pk_model.id,
+            updates={PKModel.attr("name"): "Updated Name"},
+            condition=PKModel.attr("name") == "WrongName",
+        )
+
+    assert PKModel.get_item(pk_model.id) == pk_model
+    assert PKSKModel.get_item(pk_sk_model.id, pk_sk_model.sort) is None
+
+
+def test_transaction_is_discarded_on_exception(
+    pk_model: PKModel, pk_sk_model: PKSKModel
+) -> None:
+    """Writes collected before an exception in the block are never sent."""
+    pk_sk_model.save()
+
+    with pytest.raises(ValueError, match="rollback"), PKModel.transaction():
+        pk_model.save()
+        pk_sk_model.delete()
+        raise ValueError("rollback")
+
+    assert PKModel.get_item(pk_model.id) is None
+    assert PKSKModel.get_item(pk_sk_model.id, pk_sk_model.sort) == pk_sk_model
@@ -1,7 +1,13 @@
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
 
 import pytest
+from pydantic import Field
 
 from pydamodb.async_models import (
     AsyncPrimaryKeyAndSortKeyModel,
@@ -9,7 +15,12 @@ from pydamodb.async_models import (
     _AsyncModelBatchWriter,
 )
 from pydamodb.base import PydamoConfig
-from pydamodb.exceptions import InvalidKeySchemaError, MissingSortKeyValueError
+from pydamodb.exceptions import (
+    IndexNotFoundError,
+    InvalidKeySchemaError,
+    MissingSortKeyValueError,
+    UnprocessedKeysError,
+)
 
 
 def _create_mock_async_table(pk_name: str = "id", sk_name: str | None = None) -> AsyncMock:
@@ -377,3 +388,517 @@ class TestAsyncBatchWriterWithoutContext:
 
         with pytest.raises(RuntimeError, match="batch_writer"):
             await writer.delete(item)
+
+
+class TestAsyncKeySchemaLoading:
+    """Test that the key schema is only loaded from the table once."""
+
+    @pytest.mark.asyncio
+    async def test_key_schema_loaded_once(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id")
+
+        async def _key_schema() -> list[dict[str, str]]:
+            return [{"AttributeName": "id", "KeyType": "HASH"}]
+
+        # A coroutine can only be awaited once, so a second load would fail.
+        mock_table.key_schema = _key_schema()
+        mock_table.get_item.return_value = {}
+
+        class TestModel(AsyncPrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        assert await TestModel.get_item("a") is None
+        assert await TestModel.get_item("b") is None
+        assert mock_table.get_item.await_count == 2
+        mock_table.get_item.assert_awaited_with(Key={"id": "b"}, ConsistentRead=False)
+
+
+class TestAsyncIndexKeyAttributes:
+    """Test index key attribute lookup and caching for async models."""
+
+    @staticmethod
+    def _create_table_with_indexes() -> AsyncMock:
+        mock_table = _create_mock_async_table(pk_name="id", sk_name="sort")
+
+        async def _gsis() -> list[dict[str, Any]]:
+            return [
+                {
+                    "IndexName": "status-index",
+                    "KeySchema": [{"AttributeName": "status", "KeyType": "HASH"}],
+                }
+            ]
+
+        async def _lsis() -> list[dict[str, Any]]:
+            return [
+                {
+                    "IndexName": "created-at-index",
+                    "KeySchema": [
+                        {"AttributeName": "id", "KeyType": "HASH"},
+                        {"AttributeName": "created_at", "KeyType": "RANGE"},
+                    ],
+                }
+            ]
+
+        # Coroutines can only be awaited once, so a second load would fail.
+        mock_table.global_secondary_indexes = _gsis()
+        mock_table.local_secondary_indexes = _lsis()
+        return mock_table
+
+    @pytest.mark.asyncio
+    async def test_index_key_attributes_are_cached(self) -> None:
+        mock_table = self._create_table_with_indexes()
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        gsi_attrs = await TestModel._get_index_key_attributes(index_name="status-index")
+        lsi_attrs = await TestModel._get_index_key_attributes(index_name="created-at-index")
+
+        assert gsi_attrs == ("status", None)
+        assert lsi_attrs == ("id", "created_at")
+
+    @pytest.mark.asyncio
+    async def test_unknown_index_raises(self) -> None:
+        mock_table = self._create_table_with_indexes()
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        with pytest.raises(IndexNotFoundError) as exc_info:
+            await TestModel._get_index_key_attributes(index_name="missing-index")
+
+        assert exc_info.value.index_name == "missing-index"
+
+    @pytest.mark.asyncio
+    async def test_cold_table_is_loaded_once(self) -> None:
+        mock_table = self._create_table_with_indexes()
+        mock_table.meta = MagicMock(data=None)
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        await TestModel._get_index_key_attributes(index_name="status-index")
+
+        mock_table.load.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_cache_is_reloaded_for_a_new_table(self) -> None:
+        first_table = self._create_table_with_indexes()
+        second_table = self._create_table_with_indexes()
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=first_table)
+            id: str
+            sort: str
+
+        await TestModel._get_index_key_attributes(index_name="status-index")
+        TestModel.pydamo_config = PydamoConfig(table=second_table)
+        await TestModel._get_index_key_attributes(index_name="status-index")
+
+        assert TestModel._table_index_key_attributes is not None
+        assert TestModel._table_index_key_attributes[0] is second_table
+
+
+class TestAsyncBatchWriterPut:
+    """Test _AsyncModelBatchWriter serialization."""
+
+    @pytest.mark.asyncio
+    async def test_put_serializes_model(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id")
+        mock_writer = AsyncMock()
+        mock_table.batch_writer = MagicMock(return_value=mock_writer)
+
+        class TestModel(AsyncPrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str
+
+        item = TestModel(id="x", name="y")
+        async with TestModel.batch_writer() as writer:
+            await writer.put(item)
+
+        mock_writer.put_item.assert_awaited_once_with(Item={"id": "x", "name": "y"})
+
+
+class TestAsyncQueryValidation:
+    """Test validation of query results for async models."""
+
+    @pytest.mark.asyncio
+    async def test_query_validates_page_items(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id", sk_name="sort")
+        mock_table.query.return_value = {
+            "Items": [{"id": "a", "sort": "1", "count": 1}, {"id": "a", "sort": "2", "count": 2}],
+        }
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+            count: int
+
+        _cache_schema_for_mock(TestModel)
+
+        items, last_key = await TestModel.query("a")
+
+        assert items == [
+            TestModel(id="a", sort="1", count=1),
+            TestModel(id="a", sort="2", count=2),
+        ]
+        assert last_key is None
+
+    def test_subclass_does_not_reuse_parent_adapter(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id", sk_name="sort")
+
+        class ParentModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        class ChildModel(ParentModel):
+            extra: str = "default"
+
+        parent_items = ParentModel._from_items([{"id": "a", "sort": "1"}])
+        child_items = ChildModel._from_items([{"id": "a", "sort": "1"}])
+
+        assert type(parent_items[0]) is ParentModel
+        assert type(child_items[0]) is ChildModel
+
+
+class TestAsyncTrustStored:
+    """Test the trust_stored config option for async models."""
+
+    @pytest.mark.asyncio
+    async def test_get_item_skips_validation(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id")
+        mock_table.get_item.return_value = {
+            "Item": {"id": "a", "count": Decimal(3), "ratio": Decimal("0.5"), "note": None},
+        }
+
+        class TestModel(AsyncPrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table, trust_stored=True)
+            id: str
+            count: int
+            ratio: float | None
+            note: str | None = None
+
+        _cache_schema_for_mock(TestModel)
+
+        item = await TestModel.get_item("a")
+
+        assert item is not None
+        assert item.count == 3
+        assert type(item.count) is int
+        assert item.ratio == 0.5
+        assert type(item.ratio) is float
+        assert item.note is None
+
+    @pytest.mark.asyncio
+    async def test_query_skips_validation(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id", sk_name="sort")
+        # "count" is deliberately invalid: trusted reads do not validate.
+        mock_table.query.return_value = {
+            "Items": [{"id": "a", "sort": "1", "count": "not-a-number"}],
+        }
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table, trust_stored=True)
+            id: str
+            sort: str
+            count: str | int
+
+        _cache_schema_for_mock(TestModel)
+
+        items, _ = await TestModel.query("a")
+
+        assert items[0].count == "not-a-number"
+
+    @pytest.mark.asyncio
+    async def test_get_item_converts_aliased_and_json_mode_fields(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id")
+        mock_table.get_item.return_value = {
+            "Item": {
+                "id": "a",
+                "N": Decimal(3),
+                "created_at": "2024-01-02T03:04:05Z",
+                "uid": "12345678-1234-5678-1234-567812345678",
+                "color": "red",
+                "tags": [Decimal(2), Decimal(1)],
+                "counts": {"x": Decimal(1)},
+                "labels": ["a"],
+            },
+        }
+
+        class Color(Enum):
+            RED = "red"
+
+        class TestModel(AsyncPrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table, trust_stored=True)
+            id: str
+            n: int = Field(alias="N")
+            created_at: datetime
+            uid: UUID
+            color: Color
+            tags: set[int]
+            counts: dict[str, int]
+            labels: list[str]
+
+        _cache_schema_for_mock(TestModel)
+
+        item = await TestModel.get_item("a")
+
+        assert item is not None
+        assert type(item.n) is int
+        assert item.created_at == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert item.uid == UUID("12345678-1234-5678-1234-567812345678")
+        assert item.color is Color.RED
+        assert item.tags == {1, 2}
+        assert type(item.counts["x"]) is int
+        assert item.labels == ["a"]
+
+
+class TestAsyncQueryAll:
+    """Test automatic pagination in async query_all."""
+
+    @pytest.mark.asyncio
+    async def test_query_all_follows_pagination(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id", sk_name="sort")
+        mock_table.query.side_effect = [
+            {"Items": [{"id": "a", "sort": "1"}], "LastEvaluatedKey": {"id": "a", "sort": "1"}},
+            {"Items": [{"id": "a", "sort": "2"}]},
+        ]
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        _cache_schema_for_mock(TestModel)
+
+        items = await TestModel.query_all("a")
+
+        assert [item.sort for item in items] == ["1", "2"]
+        assert mock_table.query.await_count == 2
+        first_call, second_call = mock_table.query.await_args_list
+        assert "ExclusiveStartKey" not in first_call.kwargs
+        assert second_call.kwargs["ExclusiveStartKey"] == {"id": "a", "sort": "1"}
+        # Each page gets its own values map rather than a shared cached one.
+        assert (
+            first_call.kwargs["ExpressionAttributeValues"]
+            is not second_call.kwargs["ExpressionAttributeValues"]
+        )
+
+
+class TestAsyncByKeyOperations:
+    """Test the pre-built key fast paths."""
+
+    @pytest.mark.asyncio
+    async def test_get_item_by_key_skips_schema_loading(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id", sk_name="sort")
+        mock_table.get_item.return_value = {"Item": {"id": "a", "sort": "1"}}
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        key = {"id": "a", "sort": "1"}
+        item = await TestModel.get_item_by_key(key, consistent_read=True)
+
+        assert item == TestModel(id="a", sort="1")
+        assert TestModel._cached_key_schema is None
+        mock_table.get_item.assert_awaited_once_with(Key=key, ConsistentRead=True)
+        # boto3 serializes the key in place, so the caller's dict must not be passed.
+        assert mock_table.get_item.await_args.kwargs["Key"] is not key
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_by_key(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id")
+
+        class TestModel(AsyncPrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str
+
+        await TestModel.update_item_by_key({"id": "a"}, updates={TestModel.attr("name"): "b"})
+        await TestModel.delete_item_by_key({"id": "a"})
+
+        assert mock_table.update_item.await_args.kwargs["Key"] == {"id": "a"}
+        mock_table.delete_item.assert_awaited_once_with(Key={"id": "a"})
+
+
+class TestAsyncBatchGet:
+    """Test batched reads through BatchGetItem."""
+
+    @pytest.mark.asyncio
+    async def test_batch_get_chunks_and_deduplicates_keys(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id")
+        mock_table.name = "TestTable"
+        mock_table.meta = MagicMock()
+        batch_get_item = AsyncMock(return_value={"Responses": {"TestTable": [{"id": "0"}]}})
+        mock_table.meta.client.batch_get_item = batch_get_item
+
+        class TestModel(AsyncPrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        _cache_schema_for_mock(TestModel)
+        values = [str(i) for i in range(150)]
+        items = await TestModel.batch_get([*values, "0"])
+
+        assert items == [TestModel(id="0"), TestModel(id="0")]
+        chunks = [
+            call.kwargs["RequestItems"]["TestTable"]["Keys"]
+            for call in batch_get_item.await_args_list
+        ]
+        assert [len(chunk) for chunk in chunks] == [100, 50]
+        assert [key["id"] for chunk in chunks for key in chunk] == values
+
+    @pytest.mark.asyncio
+    async def test_batch_get_retries_unprocessed_keys(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("pydamodb.async_models._BATCH_GET_BACKOFF_BASE", 0)
+        mock_table = _create_mock_async_table(pk_name="id", sk_name="sort")
+        mock_table.name = "TestTable"
+        mock_table.meta = MagicMock()
+        unprocessed = {"TestTable": {"Keys": [{"id": "a", "sort": "2"}]}}
+        batch_get_item = AsyncMock(
+            side_effect=[
+                {
+                    "Responses": {"TestTable": [{"id": "a", "sort": "1"}]},
+                    "UnprocessedKeys": unprocessed,
+                },
+                {"Responses": {"TestTable": [{"id": "a", "sort": "2"}]}, "UnprocessedKeys": {}},
+            ]
+        )
+        mock_table.meta.client.batch_get_item = batch_get_item
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        _cache_schema_for_mock(TestModel)
+        items = await TestModel.batch_get([("a", "1"), ("a", "2")])
+
+        assert sorted(item.sort for item in items) == ["1", "2"]
+        assert batch_get_item.await_args_list[1].kwargs == {"RequestItems": unprocessed}
+
+    @pytest.mark.asyncio
+    async def test_batch_get_gives_up_after_max_attempts(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("pydamodb.async_models._BATCH_GET_BACKOFF_BASE", 0)
+        mock_table = _create_mock_async_table(pk_name="id")
+        mock_table.name = "TestTable"
+        mock_table.meta = MagicMock()
+        unprocessed_keys = [{"id": "b"}]
+        batch_get_item = AsyncMock(
+            return_value={"UnprocessedKeys": {"TestTable": {"Keys": unprocessed_keys}}}
+        )
+        mock_table.meta.client.batch_get_item = batch_get_item
+
+        class TestModel(AsyncPrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        _cache_schema_for_mock(TestModel)
+
+        with pytest.raises(UnprocessedKeysError) as exc_info:
+            await TestModel.batch_get(["a", "b"])
+
+        assert exc_info.value.unprocessed_keys == unprocessed_keys
+        assert batch_get_item.await_count == 10
+
+    @pytest.mark.asyncio
+    async def test_batch_get_cancels_other_chunks_on_failure(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id")
+        mock_table.name = "TestTable"
+        mock_table.meta = MagicMock()
+        cancelled: list[bool] = []
+
+        async def batch_get_item(**kwargs: Any) -> dict[str, Any]:
+            if kwargs["RequestItems"]["TestTable"]["Keys"][0] == {"id": "0"}:
+                await asyncio.sleep(0)
+                raise RuntimeError("boom")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return {}
+
+        mock_table.meta.client.batch_get_item = batch_get_item
+
+        class TestModel(AsyncPrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        _cache_schema_for_mock(TestModel)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await TestModel.batch_get(str(i) for i in range(300))
+
+        assert cancelled == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_batch_get_bounds_concurrent_requests(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id")
+        mock_table.name = "TestTable"
+        mock_table.meta = MagicMock()
+        in_flight = 0
+        max_in_flight = 0
+
+        async def batch_get_item(**_: Any) -> dict[str, Any]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {}
+
+        mock_table.meta.client.batch_get_item = batch_get_item
+
+        class TestModel(AsyncPrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        _cache_schema_for_mock(TestModel)
+        await TestModel.batch_get(str(i) for i in range(2000))
+
+        assert max_in_flight == 8
+
+
+class TestAsyncIterAll:
+    """Test streaming pagination in async iter_all."""
+
+    @pytest.mark.asyncio
+    async def test_iter_all_yields_items_page_by_page(self) -> None:
+        mock_table = _create_mock_async_table(pk_name="id", sk_name="sort")
+        mock_table.query.side_effect = [
+            {"Items": [{"id": "a", "sort": "1"}], "LastEvaluatedKey": {"id": "a", "sort": "1"}},
+            {"Items": [{"id": "a", "sort": "2"}], "LastEvaluatedKey": {"id": "a", "sort": "2"}},
+            {"Items": [{"id": "a", "sort": "3"}]},
+        ]
+
+        class TestModel(AsyncPrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        _cache_schema_for_mock(TestModel)
+
+        iterator = TestModel.iter_all("a")
+        first = await iterator.__anext__()
+        await iterator.aclose()
+
+        assert first.sort == "1"
+        # Only the current page and the prefetched next page were requested.
+        assert mock_table.query.call_count == 2
@@ -8,7 +8,10 @@ from pydamodb.exceptions import (
     InvalidKeySchemaError,
     MissingSortKeyValueError,
     PydamoError,
+    TransactionTooLargeError,
     UnknownConditionTypeError,
+    UnprocessedItemsError,
+    UnprocessedKeysError,
 )
 
 
@@ -21,6 +24,9 @@ class TestExceptionHierarchy:
         assert issubclass(InsufficientConditionsError, PydamoError)
         assert issubclass(UnknownConditionTypeError, PydamoError)
         assert issubclass(EmptyUpdateError, PydamoError)
+        assert issubclass(UnprocessedItemsError, PydamoError)
+        assert issubclass(UnprocessedKeysError, PydamoError)
+        assert issubclass(TransactionTooLargeError, PydamoError)
 
     def test_can_catch_all_with_pydamo_error(self) -> None:
         """Test that all exceptions can be caught with PydamoError."""
@@ -30,6 +36,9 @@ class TestExceptionHierarchy:
             InsufficientConditionsError(operator="And", count=1),
             UnknownConditionTypeError(str),
             EmptyUpdateError(),
+            UnprocessedItemsError(unprocessed_items=[]),
+            UnprocessedKeysError(unprocessed_keys=[]),
+            TransactionTooLargeError(max_items=100),
         ]
 
         for exc in exceptions_to_test:
@@ -46,6 +55,23 @@ class TestOperationErrors:
         assert "get" in str(exc)
         assert "MyModel" in str(exc)
 
+    def test_unprocessed_items_error(self) -> None:
+        items = [{"PutRequest": {"Item": {"id": "1"}}}]
+        exc = UnprocessedItemsError(unprocessed_items=items)
+        assert "1 batch write item(s)" in str(exc)
+        assert exc.unprocessed_items == items
+
+    def test_unprocessed_keys_error(self) -> None:
+        keys = [{"id": "1"}, {"id": "2"}]
+        exc = UnprocessedKeysError(unprocessed_keys=keys)
+        assert "2 batch get key(s)" in str(exc)
+        assert exc.unprocessed_keys == keys
+
+    def test_transaction_too_large_error(self) -> None:
+        exc = TransactionTooLargeError(max_items=100)
+        assert "more than 100 writes" in str(exc)
+        assert exc.max_items == 100
+
 
 class TestValidationErrors:
     """Test validation error messages and attributes."""
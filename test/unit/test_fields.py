@@ -135,6 +135,31 @@ class TestAttrAliasResolution:
         assert isinstance(username_field, ExpressionField)
         assert username_field.field == "username"
 
+    def test_subclass_does_not_reuse_parent_field_paths(self) -> None:
+        mock_table = _create_mock_table()
+
+        class Base(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str
+
+        class Child(Base):
+            name: str = Field(alias="Name")
+
+        assert Base.attr("name").field == "name"
+        assert Child.attr("name").field == "Name"
+
+    def test_top_level_field_is_interned(self) -> None:
+        mock_table = _create_mock_table()
+
+        class User(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            tags: list[str]
+
+        assert User.attr("id") is User.attr("id")
+        assert User.attr("tags[0]").field == "tags[0]"
+
 
 class TestAttrNestedPath:
     """Test dot-separated nested attribute path access."""
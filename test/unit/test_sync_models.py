@@ -1,9 +1,21 @@
-from unittest.mock import MagicMock
+import typing
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
+from pydantic import BaseModel, Field
 
+from pydamodb import sync_models
 from pydamodb.base import PydamoConfig
-from pydamodb.exceptions import InvalidKeySchemaError, MissingSortKeyValueError
+from pydamodb.exceptions import (
+    IndexNotFoundError,
+    InvalidKeySchemaError,
+    MissingSortKeyValueError,
+    TransactionTooLargeError,
+    UnprocessedItemsError,
+)
 from pydamodb.sync_models import PrimaryKeyAndSortKeyModel, PrimaryKeyModel
 
 
@@ -295,3 +307,775 @@ class TestParseKeySchema:
         key_schema = [{"AttributeName": "sk", "KeyType": "RANGE"}]
         with pytest.raises(InvalidKeySchemaError):
             TestModel._parse_key_schema(key_schema=key_schema)  # ty: ignore[invalid-argument-type]
+
+
+class TestKeyAttributesCache:
+    """Test that the parsed key schema is cached per schema object."""
+
+    def test_key_schema_parsed_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        parse = MagicMock(wraps=TestModel._parse_key_schema)
+        monkeypatch.setattr(TestModel, "_parse_key_schema", parse)
+
+        TestModel._build_dynamodb_key(partition_key_value="a", sort_key_value="b")
+        TestModel._build_dynamodb_key(partition_key_value="c", sort_key_value="d")
+
+        assert parse.call_count == 1
+
+    def test_new_table_is_reparsed(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            other: str = ""
+
+        assert TestModel._partition_key_attribute() == "id"
+
+        TestModel.pydamo_config = PydamoConfig(table=_create_mock_table(pk_name="other"))
+
+        assert TestModel._partition_key_attribute() == "other"
+
+    def test_key_builder_is_specialized_per_class(self) -> None:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+
+        class Parent(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        class Child(Parent):
+            pass
+
+        assert Parent._key_builder() is Parent._key_builder()
+        assert Parent._build_dynamodb_key(partition_key_value="a", sort_key_value=1) == {
+            "id": "a",
+            "sort": 1,
+        }
+        with pytest.raises(MissingSortKeyValueError, match="Child"):
+            Child._build_dynamodb_key(partition_key_value="a")
+
+    def test_non_str_int_key_values_are_still_converted(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: bytes
+
+        assert TestModel._build_dynamodb_key(partition_key_value=b"abc") == {"id": "abc"}
+
+    def test_item_key_follows_table_changes(self) -> None:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+            other: str = "x"
+
+        item = TestModel(id="a", sort="b")
+        assert item._item_key() == {"id": "a", "sort": "b"}
+
+        TestModel.pydamo_config = PydamoConfig(table=_create_mock_table(pk_name="other"))
+
+        assert item._item_key() == {"other": "x"}
+
+
+class TestTableMetadataCache:
+    """Test that key schema and index metadata are read once per table."""
+
+    def test_key_schema_read_once_per_table(self) -> None:
+        mock_table = MagicMock()
+        key_schema = PropertyMock(return_value=[{"AttributeName": "id", "KeyType": "HASH"}])
+        type(mock_table).key_schema = key_schema
+        mock_table.get_item.return_value = {}
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        TestModel.get_item("a")
+        TestModel.get_item("b")
+
+        assert key_schema.call_count == 1
+
+    def test_index_key_attributes_are_cached(self) -> None:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+        gsis = PropertyMock(
+            return_value=[
+                {
+                    "IndexName": "status-index",
+                    "KeySchema": [{"AttributeName": "status", "KeyType": "HASH"}],
+                }
+            ]
+        )
+        type(mock_table).global_secondary_indexes = gsis
+        mock_table.local_secondary_indexes = [
+            {
+                "IndexName": "created-at-index",
+                "KeySchema": [
+                    {"AttributeName": "id", "KeyType": "HASH"},
+                    {"AttributeName": "created_at", "KeyType": "RANGE"},
+                ],
+            }
+        ]
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        assert TestModel._get_index_key_attributes(index_name="status-index") == ("status", None)
+        assert TestModel._get_index_key_attributes(index_name="created-at-index") == (
+            "id",
+            "created_at",
+        )
+        assert gsis.call_count == 1
+
+        with pytest.raises(IndexNotFoundError):
+            TestModel._get_index_key_attributes(index_name="missing-index")
+
+
+class TestBuildPutKwargs:
+    """Test item serialization for put operations."""
+
+    def test_item_matches_json_model_dump(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class Address(BaseModel):
+            city: str
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            created_at: datetime
+            address: Address
+            nickname: str | None = Field(default=None, alias="nick")
+
+        item = TestModel(
+            id="my-id",
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            address=Address(city="Springfield"),
+            nick="homer",
+        )
+
+        put_kwargs = item._build_put_kwargs(condition=None)
+        assert put_kwargs == {"Item": item.model_dump(mode="json")}
+        assert put_kwargs["Item"]["created_at"] == "2024-01-01T00:00:00Z"
+        assert put_kwargs["Item"]["nickname"] == "homer"
+
+    def test_batch_writer_put_uses_json_item(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            created_at: datetime
+
+        item = TestModel(id="my-id", created_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        mock_table.meta.client.batch_write_item.return_value = {}
+
+        with TestModel.batch_writer() as writer:
+            writer.put(item)
+
+        mock_table.meta.client.batch_write_item.assert_called_once_with(
+            RequestItems={
+                mock_table.name: [
+                    {"PutRequest": {"Item": {"id": "my-id", "created_at": "2024-01-01T00:00:00Z"}}}
+                ]
+            }
+        )
+
+
+class TestBatchWriter:
+    """Test the buffered sync batch writer."""
+
+    def test_requests_are_sent_in_batches_of_25(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.meta.client.batch_write_item.return_value = {}
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str = ""
+
+        with TestModel.batch_writer() as writer:
+            for i in range(30):
+                writer.put(TestModel(id=str(i)))
+            assert mock_table.meta.client.batch_write_item.call_count == 1
+
+        calls = mock_table.meta.client.batch_write_item.call_args_list
+        assert [len(call.kwargs["RequestItems"][mock_table.name]) for call in calls] == [25, 5]
+
+    def test_delete_sends_key(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.meta.client.batch_write_item.return_value = {}
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str = ""
+
+        with TestModel.batch_writer() as writer:
+            writer.delete(TestModel(id="1"))
+
+        mock_table.meta.client.batch_write_item.assert_called_once_with(
+            RequestItems={mock_table.name: [{"DeleteRequest": {"Key": {"id": "1"}}}]}
+        )
+
+    def test_unprocessed_items_are_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(sync_models, "_BATCH_WRITE_BACKOFF_BASE", 0)
+        mock_table = _create_mock_table(pk_name="id")
+        unprocessed = [{"PutRequest": {"Item": {"id": "2", "name": ""}}}]
+        mock_table.meta.client.batch_write_item.side_effect = [
+            {"UnprocessedItems": {mock_table.name: unprocessed}},
+            {"UnprocessedItems": {}},
+        ]
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str = ""
+
+        with TestModel.batch_writer() as writer:
+            writer.put(TestModel(id="1"))
+            writer.put(TestModel(id="2"))
+
+        calls = mock_table.meta.client.batch_write_item.call_args_list
+        assert len(calls) == 2
+        assert calls[1].kwargs["RequestItems"] == {mock_table.name: unprocessed}
+
+    def test_gives_up_after_max_attempts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(sync_models, "_BATCH_WRITE_BACKOFF_BASE", 0)
+        mock_table = _create_mock_table(pk_name="id")
+        unprocessed = [{"PutRequest": {"Item": {"id": "1", "name": ""}}}]
+        mock_table.meta.client.batch_write_item.return_value = {
+            "UnprocessedItems": {mock_table.name: unprocessed}
+        }
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str = ""
+
+        with pytest.raises(UnprocessedItemsError) as exc_info, TestModel.batch_writer() as writer:
+            writer.put(TestModel(id="1"))
+
+        assert exc_info.value.unprocessed_items == unprocessed
+        assert mock_table.meta.client.batch_write_item.call_count == 10
+
+    def test_overwrite_by_pkeys_keeps_last_request(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.meta.client.batch_write_item.return_value = {}
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str = ""
+
+        with TestModel.batch_writer(overwrite_by_pkeys=["id"]) as writer:
+            writer.put(TestModel(id="1", name="Homer"))
+            writer.put(TestModel(id="2", name="Marge"))
+            writer.put(TestModel(id="1", name="Bart"))
+
+        mock_table.meta.client.batch_write_item.assert_called_once_with(
+            RequestItems={
+                mock_table.name: [
+                    {"PutRequest": {"Item": {"id": "2", "name": "Marge"}}},
+                    {"PutRequest": {"Item": {"id": "1", "name": "Bart"}}},
+                ]
+            }
+        )
+
+    def test_batches_are_sent_without_holding_the_lock(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        writer = TestModel.batch_writer()
+        lock_held: list[bool] = []
+
+        def batch_write_item(**_: Any) -> dict[str, Any]:
+            lock_held.append(writer._lock.locked())
+            return {}
+
+        mock_table.meta.client.batch_write_item.side_effect = batch_write_item
+        with writer:
+            for i in range(30):
+                writer.put(TestModel(id=str(i)))
+
+        assert lock_held == [False, False]
+
+
+class TestBackgroundBatchWriter:
+    """Test the batch writer sending from a worker thread."""
+
+    def test_batches_are_sent_by_the_worker(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.meta.client.batch_write_item.return_value = {}
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        with TestModel.batch_writer(background=True) as writer:
+            for i in range(60):
+                writer.put(TestModel(id=str(i)))
+
+        calls = mock_table.meta.client.batch_write_item.call_args_list
+        sent = [call.kwargs["RequestItems"][mock_table.name] for call in calls]
+        assert [len(batch) for batch in sent] == [25, 25, 10]
+        assert sent[0][0] == {"PutRequest": {"Item": {"id": "0"}}}
+
+    def test_send_errors_are_raised_on_exit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(sync_models, "_BATCH_WRITE_BACKOFF_BASE", 0)
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.meta.client.batch_write_item.return_value = {
+            "UnprocessedItems": {mock_table.name: [{"PutRequest": {"Item": {"id": "0"}}}]}
+        }
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        with (
+            pytest.raises(UnprocessedItemsError),
+            TestModel.batch_writer(background=True) as writer,
+        ):
+            for i in range(25):
+                writer.put(TestModel(id=str(i)))
+
+    def test_batches_after_a_failure_are_not_sent(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(sync_models, "_BATCH_WRITE_BACKOFF_BASE", 0)
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.meta.client.batch_write_item.return_value = {
+            "UnprocessedItems": {mock_table.name: [{"PutRequest": {"Item": {"id": "0"}}}]}
+        }
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        with (
+            pytest.raises(UnprocessedItemsError),
+            TestModel.batch_writer(background=True) as writer,
+        ):
+            for i in range(75):
+                writer.put(TestModel(id=str(i)))
+
+        # Only the first batch's attempts were made; the other two were drained unsent.
+        assert mock_table.meta.client.batch_write_item.call_count == 10
+
+    def test_error_in_block_is_not_replaced_by_send_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(sync_models, "_BATCH_WRITE_BACKOFF_BASE", 0)
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.meta.client.batch_write_item.return_value = {
+            "UnprocessedItems": {mock_table.name: [{"PutRequest": {"Item": {"id": "0"}}}]}
+        }
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        with (
+            pytest.raises(ValueError, match="boom"),
+            TestModel.batch_writer(background=True) as writer,
+        ):
+            for i in range(25):
+                writer.put(TestModel(id=str(i)))
+            raise ValueError("boom")
+
+
+class TestBuildUpdateKwargs:
+    """Test building kwargs for update_item operations."""
+
+    def test_unconditional_update_reuses_expression_scaffolding(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str
+            count: int
+
+        updates = {TestModel.attr("name"): "a", TestModel.attr("count"): 1}
+        first = TestModel._build_update_kwargs(key={"id": "1"}, updates=updates, condition=None)
+        updates = {TestModel.attr("name"): "b", TestModel.attr("count"): 2}
+        second = TestModel._build_update_kwargs(key={"id": "2"}, updates=updates, condition=None)
+
+        assert first == {
+            "Key": {"id": "1"},
+            "UpdateExpression": "SET #n0 = :v0, #n1 = :v1",
+            "ExpressionAttributeNames": {"#n0": "name", "#n1": "count"},
+            "ExpressionAttributeValues": {":v0": "a", ":v1": 1},
+        }
+        assert second["Key"] == {"id": "2"}
+        assert second["ExpressionAttributeValues"] == {":v0": "b", ":v1": 2}
+        assert second["UpdateExpression"] is first["UpdateExpression"]
+        assert second["ExpressionAttributeValues"] is not first["ExpressionAttributeValues"]
+
+    def test_conditional_update_matches_template_layout(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str
+
+        update_kwargs = TestModel._build_update_kwargs(
+            key={"id": "1"},
+            updates={TestModel.attr("name"): "a"},
+            condition=TestModel.attr("name") == "old",
+        )
+
+        assert update_kwargs == {
+            "ConditionExpression": "#n0 = :v1",
+            "Key": {"id": "1"},
+            "UpdateExpression": "SET #n0 = :v0",
+            "ExpressionAttributeNames": {"#n0": "name"},
+            "ExpressionAttributeValues": {":v0": "a", ":v1": "old"},
+        }
+
+    def test_nested_path_updates_are_not_cached(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str
+            counts: dict[str, int]
+
+        for i in range(100):
+            update_kwargs = TestModel._build_update_kwargs(
+                key={"id": "1"}, updates={TestModel.attr(f"counts.user-{i}"): i}, condition=None
+            )
+        TestModel._build_update_kwargs(
+            key={"id": "1"}, updates={TestModel.attr("name"): "a"}, condition=None
+        )
+
+        assert update_kwargs["ExpressionAttributeNames"] == {"#n0": "counts", "#n1": "user-99"}
+        assert TestModel._update_templates is not None
+        assert list(TestModel._update_templates) == [("name",)]
+
+
+class TestBuildQueryKwargs:
+    """Test building kwargs for query operations."""
+
+    @staticmethod
+    def _build(model: type[PrimaryKeyAndSortKeyModel], **overrides: Any) -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "partition_key_attribute": "id",
+            "partition_key_value": "pk",
+            "sort_key_condition": None,
+            "filter_condition": None,
+            "limit": None,
+            "consistent_read": False,
+            "exclusive_start_key": None,
+            "index_name": None,
+        }
+        options.update(overrides)
+        return model._build_query_kwargs(**options)
+
+    def test_partition_key_only_query(self) -> None:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        query_kwargs = self._build(TestModel, index_name="status-index", limit=10)
+
+        assert query_kwargs == {
+            "KeyConditionExpression": "#n0 = :v0",
+            "ConsistentRead": False,
+            "IndexName": "status-index",
+            "ExpressionAttributeNames": {"#n0": "id"},
+            "ExpressionAttributeValues": {":v0": "pk"},
+            "Limit": 10,
+        }
+
+    def test_partition_key_only_query_values_are_not_shared(self) -> None:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        first = self._build(TestModel, partition_key_value="a")
+        second = self._build(TestModel, partition_key_value="b", exclusive_start_key={"id": "b"})
+
+        assert first["ExpressionAttributeValues"] == {":v0": "a"}
+        assert second["ExpressionAttributeValues"] == {":v0": "b"}
+        assert "ExclusiveStartKey" not in first
+        assert second["ExclusiveStartKey"] == {"id": "b"}
+
+    def test_query_with_conditions(self) -> None:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+            status: str
+
+        query_kwargs = self._build(
+            TestModel,
+            sort_key_condition=TestModel.attr("sort").begins_with("2024"),
+            filter_condition=TestModel.attr("status") == "active",
+        )
+
+        assert query_kwargs == {
+            "KeyConditionExpression": "#n0 = :v0 AND begins_with(#n1, :v1)",
+            "ConsistentRead": False,
+            "FilterExpression": "#n2 = :v2",
+            "ExpressionAttributeNames": {"#n0": "id", "#n1": "sort", "#n2": "status"},
+            "ExpressionAttributeValues": {":v0": "pk", ":v1": "2024", ":v2": "active"},
+        }
+
+
+class TestQueryAll:
+    """Test automatic pagination in query_all."""
+
+    @staticmethod
+    def _create_paged_table(pages: list[dict[str, Any]]) -> MagicMock:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+        mock_table.name = "TestTable"
+        mock_table.meta.client.query.side_effect = pages
+        return mock_table
+
+    def test_single_page(self) -> None:
+        mock_table = self._create_paged_table([{"Items": [{"id": "a", "sort": "1"}]}])
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        items = TestModel.query_all("a")
+
+        assert items == [TestModel(id="a", sort="1")]
+        query_kwargs = mock_table.meta.client.query.call_args.kwargs
+        assert query_kwargs["TableName"] == "TestTable"
+        assert "ExclusiveStartKey" not in query_kwargs
+
+    def test_follows_pagination(self) -> None:
+        mock_table = self._create_paged_table(
+            [
+                {"Items": [{"id": "a", "sort": "1"}], "LastEvaluatedKey": {"id": "a", "sort": "1"}},
+                {"Items": [{"id": "a", "sort": "2"}], "LastEvaluatedKey": {"id": "a", "sort": "2"}},
+                {"Items": [{"id": "a", "sort": "3"}]},
+            ]
+        )
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            sort: str
+
+        items = TestModel.query_all("a")
+
+        assert [item.sort for item in items] == ["1", "2", "3"]
+        start_keys = [
+            call.kwargs.get("ExclusiveStartKey")
+            for call in mock_table.meta.client.query.call_args_list
+        ]
+        assert start_keys == [None, {"id": "a", "sort": "1"}, {"id": "a", "sort": "2"}]
+
+
+class TestTrustStored:
+    """Test the trust_stored config option for sync models."""
+
+    def test_get_item_skips_validation(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.get_item.return_value = {"Item": {"id": "a", "count": Decimal(3)}}
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table, trust_stored=True)
+            id: str
+            count: int
+
+        item = TestModel.get_item("a")
+
+        assert item is not None
+        assert type(item.count) is int
+
+    def test_query_all_skips_validation(self) -> None:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+        mock_table.name = "TestTable"
+        # "count" is deliberately invalid: trusted reads do not validate.
+        mock_table.meta.client.query.return_value = {
+            "Items": [{"id": "a", "sort": "1", "count": "not-a-number"}],
+        }
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table, trust_stored=True)
+            id: str
+            sort: str
+            count: str | int
+
+        items = TestModel.query_all("a")
+
+        assert items[0].count == "not-a-number"
+
+    def test_nested_models_are_rebuilt(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.get_item.return_value = {
+            "Item": {
+                "id": "a",
+                "address": {"city": "Springfield", "number": Decimal(742)},
+                "previous": None,
+                "others": [{"city": "Shelbyville", "number": Decimal(1)}],
+            }
+        }
+
+        class Address(BaseModel):
+            city: str
+            number: int
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table, trust_stored=True)
+            id: str
+            address: Address
+            previous: Address | None = None
+            others: list[Address]
+
+        item = TestModel.get_item("a")
+
+        assert item is not None
+        assert item.address == Address(city="Springfield", number=742)
+        assert type(item.address.number) is int
+        assert item.previous is None
+        assert item.others == [Address(city="Shelbyville", number=1)]
+        # Nested converters are cached on the nested class, not in a module-level dict.
+        assert "_trusted_converters" in Address.__dict__
+
+    def test_aliased_and_datetime_fields_are_converted(self) -> None:
+        mock_table = _create_mock_table(pk_name="id", sk_name="sort")
+        stored = {"id": "a", "sort": "1", "N": Decimal(3), "created_at": "2024-01-02T03:04:05Z"}
+        mock_table.get_item.return_value = {"Item": dict(stored)}
+        mock_table.query.return_value = {"Items": [dict(stored)]}
+        mock_table.meta.client.query.return_value = {"Items": [dict(stored)]}
+
+        class TestModel(PrimaryKeyAndSortKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table, trust_stored=True)
+            id: str
+            sort: str
+            n: int = Field(alias="N")
+            created_at: datetime
+
+        fetched = TestModel.get_item("a", "1")
+        queried, _ = TestModel.query("a")
+        queried_all = TestModel.query_all("a")
+
+        for item in (fetched, queried[0], queried_all[0]):
+            assert item is not None
+            assert type(item.n) is int
+            assert item.created_at == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    def test_unparameterized_list_is_left_as_stored(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.get_item.return_value = {"Item": {"id": "a", "tags": ["x", Decimal(1)]}}
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table, trust_stored=True)
+            id: str
+            tags: typing.List  # noqa: UP006
+
+        item = TestModel.get_item("a")
+
+        assert item is not None
+        assert item.tags == ["x", Decimal(1)]
+
+
+class TestTransaction:
+    """Test grouping sync writes into TransactWriteItems."""
+
+    def test_writes_are_sent_together_on_exit(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+        mock_table.name = "TestTable"
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+            name: str
+
+        with TestModel.transaction():
+            TestModel(id="1", name="Homer").save()
+            TestModel.update_item("2", updates={TestModel.attr("name"): "Marge"})
+            TestModel.delete_item("3")
+            mock_table.meta.client.transact_write_items.assert_not_called()
+
+        mock_table.put_item.assert_not_called()
+        mock_table.update_item.assert_not_called()
+        mock_table.delete_item.assert_not_called()
+        mock_table.meta.client.transact_write_items.assert_called_once_with(
+            TransactItems=[
+                {"Put": {"TableName": "TestTable", "Item": {"id": "1", "name": "Homer"}}},
+                {
+                    "Update": {
+                        "TableName": "TestTable",
+                        "Key": {"id": "2"},
+                        "UpdateExpression": "SET #n0 = :v0",
+                        "ExpressionAttributeNames": {"#n0": "name"},
+                        "ExpressionAttributeValues": {":v0": "Marge"},
+                    }
+                },
+                {"Delete": {"TableName": "TestTable", "Key": {"id": "3"}}},
+            ]
+        )
+
+    def test_writes_are_discarded_on_error(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        with pytest.raises(RuntimeError), TestModel.transaction():
+            TestModel(id="1").save()
+            raise RuntimeError
+
+        mock_table.meta.client.transact_write_items.assert_not_called()
+        TestModel(id="2").save()
+        mock_table.put_item.assert_called_once_with(Item={"id": "2"})
+
+    def test_nested_transactions_join_the_outer_one(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        with TestModel.transaction():
+            TestModel(id="1").save()
+            with TestModel.transaction():
+                TestModel(id="2").save()
+            mock_table.meta.client.transact_write_items.assert_not_called()
+
+        (call,) = mock_table.meta.client.transact_write_items.call_args_list
+        assert len(call.kwargs["TransactItems"]) == 2
+
+    def test_too_many_writes(self) -> None:
+        mock_table = _create_mock_table(pk_name="id")
+
+        class TestModel(PrimaryKeyModel):
+            pydamo_config = PydamoConfig(table=mock_table)
+            id: str
+
+        with pytest.raises(TransactionTooLargeError), TestModel.transaction():
+            for i in range(101):
+                TestModel(id=str(i)).save()
+
+        mock_table.meta.client.transact_write_items.assert_not_called()